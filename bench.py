@@ -421,7 +421,8 @@ def main() -> int:
         "--history-file",
         default="nightly-history.json",
         metavar="PATH",
-        help="Path to nightly history JSON file (default: nightly-history.json)",
+        help="Path to nightly history JSON file, gzip-compressed if it ends in .gz "
+        "(default: nightly-history.json)",
     )
     nightly_subparsers = nightly_parser.add_subparsers(
         dest="nightly_command", help="Nightly commands"
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from bench import jsonio
+
 
 @dataclass(frozen=True)
 class RunArtifactRecord:
@@ -77,12 +78,12 @@ class ArtifactStore:
                 for path in comparisons
             ],
         }
-        self.manifest_path.write_text(json.dumps(data, indent=2) + "\n")
+        self.manifest_path.write_bytes(jsonio.dumps(data, indent=True) + b"\n")
         return self.manifest_path
 
     def load_manifest(self) -> dict[str, Any]:
         """Load artifact metadata."""
-        return json.loads(self.manifest_path.read_text())
+        return jsonio.loads(self.manifest_path.read_bytes())
 
     def load_runs(self) -> list[ArtifactRun]:
         """Load run artifact records with paths resolved against the root."""
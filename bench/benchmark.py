@@ -225,8 +225,8 @@ class BenchmarkPhase:
 
         fd, path = tempfile.mkstemp(suffix=".sh", prefix=f"bench_{name}_")
         os.write(fd, content.encode())
+        os.fchmod(fd, 0o755)
         os.close(fd)
-        os.chmod(path, 0o755)
 
         script_path = Path(path)
         self._temp_scripts.append(script_path)
@@ -256,19 +256,24 @@ class BenchmarkPhase:
             f'rm -rf "{tmp_datadir}"/*',
         ]
 
-        # Copy datadir if provided (skip for fresh sync)
+        # Copy datadir if provided (skip for fresh sync). On btrfs/XFS a
+        # reflink copy shares extents with the snapshot instead of copying data
         if original_datadir:
-            commands.append(f'cp -r "{original_datadir}"/* "{tmp_datadir}"')
+            reflink = " --reflink=auto" if self.capabilities.cp_reflink else ""
+            commands.append(f'cp -r{reflink} "{original_datadir}"/* "{tmp_datadir}"')
 
-        # Drop caches if available
-        if self.capabilities.can_drop_caches and not self.environment.no_cache_drop:
-            commands.append(self.capabilities.drop_caches_path)
-
-        # Clean debug logs
+        # Clean debug logs. bitcoind writes debug.log to the datadir (mainnet)
+        # or a chain subdirectory, so stop at depth 2 instead of walking the
+        # whole block and LevelDB tree
         commands.append(
-            f'find "{tmp_datadir}" -name debug.log -delete 2>/dev/null || true'
+            f'find "{tmp_datadir}" -maxdepth 2 -name debug.log -delete 2>/dev/null'
+            " || true"
         )
 
+        # Drop caches last, so no preparation step refills them
+        if self.capabilities.can_drop_caches and not self.environment.no_cache_drop:
+            commands.append(self.capabilities.drop_caches_cmd)
+
         return self._create_temp_script(commands, "prepare")
 
     def _create_cleanup_script(
@@ -386,7 +391,7 @@ class BenchmarkPhase:
 
         # Copy debug log if exists (all runs)
         commands.append(
-            f'debug_log=$(find "{tmp_datadir}" -name debug.log -print -quit); '
+            f'debug_log=$(find "{tmp_datadir}" -maxdepth 2 -name debug.log -print -quit); '
             f'if [ -n "$debug_log" ]; then cp "$debug_log" "{output_dir}/{name}-debug.log"; fi'
         )
 
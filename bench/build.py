@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,7 +12,7 @@ if TYPE_CHECKING:
     from .capabilities import Capabilities
 
 from .environment import BuildEnvironment
-from .utils import GitState, git_checkout, git_rev_parse
+from .utils import GitState, copy_file, git_checkout, git_rev_parse
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +159,7 @@ class BuildPhase:
             output_path.chmod(0o755)
             output_path.unlink()
 
-        shutil.copy2(nix_binary, output_path)
+        copy_file(nix_binary, output_path)
         output_path.chmod(0o755)  # Ensure it's executable and writable
         logger.info(f"  Built {name} binary: {output_path}")
 
@@ -6,8 +6,11 @@ on systems without all capabilities (with appropriate warnings).
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
+import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -18,6 +21,9 @@ DROP_CACHES_PATHS = [
     "/usr/local/bin/drop-caches",
 ]
 
+# Written directly when the process may (e.g. root in a benchmark container)
+DROP_CACHES_PROC = "/proc/sys/vm/drop_caches"
+
 # Known paths for fstrim wrapper
 FSTRIM_PATHS = [
     "/run/wrappers/bin/fstrim",
@@ -32,6 +38,7 @@ class Capabilities:
     # Cache management
     can_drop_caches: bool
     drop_caches_path: str | None
+    drop_caches_direct: bool
 
     # Disk TRIM
     can_fstrim: bool
@@ -50,6 +57,21 @@ class Capabilities:
     is_nixos: bool
     is_ci: bool
 
+    @functools.cached_property
+    def cp_reflink(self) -> bool:
+        """Whether cp accepts --reflink=auto (GNU coreutils).
+
+        Probed on first use, since it runs cp and only benchmark runs need it.
+        """
+        return _cp_supports_reflink()
+
+    @property
+    def drop_caches_cmd(self) -> str | None:
+        """Shell command that drops the page cache, if possible."""
+        if self.drop_caches_direct:
+            return f"sync && echo 3 > {DROP_CACHES_PROC}"
+        return self.drop_caches_path
+
     def check_for_run(self, instrumented: str | bool = "uninstrumented") -> list[str]:
         """Check if we have required capabilities for a benchmark run.
 
@@ -141,6 +163,21 @@ def _find_drop_caches() -> str | None:
     return None
 
 
+def _can_write_drop_caches() -> bool:
+    """Check if this process may write to /proc/sys/vm/drop_caches.
+
+    Opening write-only checks permission (and a read-only /proc/sys mount)
+    without dropping anything; caches are only dropped on write. The file
+    is opened without O_CREAT or O_TRUNC, so probing never modifies it.
+    """
+    try:
+        fd = os.open(DROP_CACHES_PROC, os.O_WRONLY)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
 def _find_fstrim() -> str | None:
     """Find fstrim executable."""
     for path in FSTRIM_PATHS:
@@ -149,6 +186,18 @@ def _find_fstrim() -> str | None:
     return None
 
 
+def _cp_supports_reflink() -> bool:
+    """Check if cp accepts --reflink=auto for copy-on-write copies."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        src = Path(temp_dir) / "src"
+        src.touch()
+        result = subprocess.run(
+            ["cp", "--reflink=auto", str(src), str(Path(temp_dir) / "dest")],
+            capture_output=True,
+        )
+    return result.returncode == 0
+
+
 def _is_nixos() -> bool:
     """Check if we're running on NixOS."""
     return Path("/etc/NIXOS").exists()
@@ -157,11 +206,13 @@ def _is_nixos() -> bool:
 def detect_capabilities() -> Capabilities:
     """Auto-detect system capabilities."""
     drop_caches_path = _find_drop_caches()
+    drop_caches_direct = _can_write_drop_caches()
     fstrim_path = _find_fstrim()
 
     return Capabilities(
-        can_drop_caches=drop_caches_path is not None,
+        can_drop_caches=drop_caches_direct or drop_caches_path is not None,
         drop_caches_path=drop_caches_path,
+        drop_caches_direct=drop_caches_direct,
         can_fstrim=fstrim_path is not None,
         fstrim_path=fstrim_path,
         has_hyperfine=_check_executable("hyperfine"),
@@ -0,0 +1,50 @@
+"""Downsampling of chart series for embedding in HTML pages."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> list[int]:
+    """Select points with Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. The points in between are
+    split into ``threshold - 2`` buckets, and from each bucket the point
+    forming the largest triangle with the previously selected point and the
+    average of the next bucket is kept, which preserves peaks and dips.
+
+    Args:
+        x: Point x values, in ascending order
+        y: Point y values
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Indices of the selected points, in ascending order
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / count
+        avg_y = sum(y[next_start:next_end]) / count
+
+        best = start = int(i * every) + 1
+        best_area = -1.0
+        for j in range(start, int((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
@@ -0,0 +1,58 @@
+"""JSON encoding helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson is optional - gracefully fall back to the stdlib encoder
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Both backends produce the same bytes, so encodings may be used as keys.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with two-space indentation
+        sort_keys: Sort object keys, giving a canonical encoding
+        default: Called for objects the encoder does not support natively.
+            Dataclasses are passed to it too, rather than being encoded
+            field by field, so both backends produce the same document.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS if default else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    # Match orjson's output: compact separators unless indenting
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=default,
+    ).encode()
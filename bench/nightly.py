@@ -2,19 +2,49 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import gzip
 import hashlib
-import json
 import logging
+import math
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from bench import jsonio
+from bench.downsample import lttb
 
 logger = logging.getLogger(__name__)
 
 NUM_COLORS = 10
 
+# Series colors for the nightly charts, indexed by series_color_index()
+PALETTE = (
+    "#3B4CC0",
+    "#D43D2A",
+    "#008060",
+    "#7A3DB8",
+    "#A65300",
+    "#087E8B",
+    "#C2185B",
+    "#4D7C0F",
+    "#8E24AA",
+    "#8A6400",
+)
+
+# Most points drawn per series on the nightly chart
+MAX_CHART_POINTS = 1000
+
+# Days of history kept at full resolution in the binary-aggregated chart
+RECENT_DAYS = 28
+
+# Width of the first aggregation bucket beyond the recent window
+BASE_BUCKET_DAYS = 7
+
 
 def _dbcache_from_config(config: dict[str, Any]) -> int:
     """Return dbcache from a run config snapshot."""
@@ -32,6 +62,7 @@ def series_color_index(key: str) -> int:
     return int.from_bytes(hash_bytes[:4], "little") % NUM_COLORS
 
 
+@functools.cache
 def _normalize_cpu_model(cpu_model: str) -> str:
     """Normalize CPU model to short identifier.
 
@@ -77,18 +108,24 @@ def _normalize_disk_type(disk_type: str) -> str:
     return disk_lower[:10]
 
 
-def _extract_cpu_short_name(cpu_model: str) -> str:
-    """Extract a readable short CPU name for labels."""
-    patterns = [
+# Readable CPU names for series labels, tried in order
+CPU_SHORT_NAME_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"Ryzen \d+ \d+",
         r"EPYC \d+",
         r"M\d+ (?:Pro|Max|Ultra)?",
         r"i[3579]-\d+\w*",
         r"Xeon \w+-\d+",
-    ]
+    )
+)
 
-    for pattern in patterns:
-        match = re.search(pattern, cpu_model, re.IGNORECASE)
+
+@functools.cache
+def _extract_cpu_short_name(cpu_model: str) -> str:
+    """Extract a readable short CPU name for labels."""
+    for pattern in CPU_SHORT_NAME_RES:
+        match = pattern.search(cpu_model)
         if match:
             return match.group(0)
 
@@ -149,7 +186,160 @@ def series_label(result: "NightlyResult") -> str:
     )
 
 
-@dataclass
+def _aggregate_binary(
+    chart_data: list[dict], recent_days: int = RECENT_DAYS
+) -> list[dict]:
+    """Coarsen old chart points into exponentially wider time buckets.
+
+    Points less than ``recent_days`` older than the newest point are kept as-is.
+    Older points are grouped per series into buckets whose width doubles each
+    time their age doubles (1 week, then 2, 4, ... weeks), so the number of
+    points grows with the log of the history length rather than linearly.
+    Buckets are aligned to multiples of their width in days since 0001-01-01
+    (a Monday), so history does not shift between buckets from night to night.
+
+    Each bucket becomes one point with the mean of the bucket means and the
+    pooled stddev. It has no commit; instead it records how many results it
+    aggregates and the dates of the first and last of them.
+    """
+    if not chart_data:
+        return []
+
+    dates = {d["date"]: date.fromisoformat(d["date"]) for d in chart_data}
+    newest = max(dates.values())
+
+    aggregated = []
+    buckets: dict[tuple[str, int, int], list[dict]] = {}
+    for d in chart_data:
+        day = dates[d["date"]]
+        age = (newest - day).days
+        if age < recent_days:
+            aggregated.append(d)
+            continue
+        level = (age // recent_days).bit_length() - 1
+        width = BASE_BUCKET_DAYS << level
+        bucket = (day.toordinal() - 1) // width
+        buckets.setdefault((d["series_key"], level, bucket), []).append(d)
+
+    for points in buckets.values():
+        first = min(dates[p["date"]] for p in points)
+        last = max(dates[p["date"]] for p in points)
+        middle = date.fromordinal((first.toordinal() + last.toordinal()) // 2)
+        aggregated.append(
+            {
+                "date": middle.isoformat(),
+                "commit": "",
+                "mean": sum(p["mean"] for p in points) / len(points),
+                "stddev": math.sqrt(
+                    sum((p["stddev"] or 0) ** 2 for p in points) / len(points)
+                ),
+                "series_key": points[0]["series_key"],
+                "series_label": points[0]["series_label"],
+                "color_index": points[0]["color_index"],
+                "aggregated": len(points),
+                "first_date": first.isoformat(),
+                "last_date": last.isoformat(),
+            }
+        )
+
+    aggregated.sort(key=lambda d: d["date"])
+    return aggregated
+
+
+def _error_color(hex_color: str) -> str:
+    """Translucent variant of a palette color for error bars."""
+    r, g, b = (int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({r}, {g}, {b}, 0.3)"
+
+
+def _point_customdata(point: dict, stddev: float) -> list:
+    """Return the per-point data the chart pages read on hover and click."""
+    if not point.get("aggregated"):
+        return [point["commit"], stddev]
+    count = point["aggregated"]
+    summary = (
+        f"Mean of {count} nightly run{'s' if count != 1 else ''}, "
+        f"{point['first_date']} to {point['last_date']}"
+    )
+    return ["", stddev, summary]
+
+
+def _point_marker(points: list[dict], size: int) -> dict[str, Any]:
+    """Return the marker style for a trace, setting aggregated points apart."""
+    marker: dict[str, Any] = {"size": size}
+    if any(d.get("aggregated") for d in points):
+        marker["symbol"] = [
+            "diamond-open" if d.get("aggregated") else "circle" for d in points
+        ]
+    return marker
+
+
+def build_chart_traces(
+    chart_data: list[dict],
+    source: str = "",
+    marker_size: int = 8,
+    max_points: int | None = None,
+) -> list[dict]:
+    """Build the Plotly line traces for chart data, one per series.
+
+    Series are ordered by label and points by date, with times converted
+    to minutes, so the page can pass the traces straight to Plotly. Each
+    commit is sent once, in customdata; the page derives the short hashes
+    shown on hover from it. Aggregated points have no commit and carry a
+    description of the results they average instead, and are drawn with
+    a distinct marker.
+
+    Args:
+        chart_data: Points as returned by NightlyHistory.get_chart_data()
+        source: Optional tag such as 'nightly' appended to trace names
+        marker_size: Size of the point markers
+        max_points: Downsample longer series to this many points with LTTB
+    """
+    series: dict[str, list[dict]] = {}
+    for d in chart_data:
+        series.setdefault(d["series_key"], []).append(d)
+
+    traces = []
+    for points in sorted(series.values(), key=lambda p: p[0]["series_label"]):
+        points = sorted(points, key=lambda d: d["date"])
+        if max_points is not None and len(points) > max_points:
+            keep = lttb(
+                [date.fromisoformat(d["date"]).toordinal() for d in points],
+                [d["mean"] for d in points],
+                max_points,
+            )
+            points = [points[i] for i in keep]
+        label = points[0]["series_label"]
+        name = f"{label} ({source})" if source else label
+        extra = f"{label} {source}" if source else label
+        color = PALETTE[points[0]["color_index"] % len(PALETTE)]
+        stddevs = [(d["stddev"] or 0) / 60 for d in points]
+        traces.append(
+            {
+                "name": name,
+                "x": [d["date"] for d in points],
+                "y": [d["mean"] / 60 for d in points],
+                "customdata": [
+                    _point_customdata(d, stddev) for d, stddev in zip(points, stddevs)
+                ],
+                "hovertemplate": "<b>%{text}</b><br>%{y:.1f} min<br>"
+                f"\u00b1%{{customdata[1]:.1f}} min<extra>{extra}</extra>",
+                "mode": "lines+markers",
+                "line": {"color": color, "width": 2},
+                "marker": _point_marker(points, marker_size),
+                "error_y": {
+                    "type": "data",
+                    "array": stddevs,
+                    "visible": True,
+                    "color": _error_color(color),
+                    "thickness": 1.5,
+                },
+            }
+        )
+    return traces
+
+
+@dataclass(slots=True, frozen=True)
 class NightlyResult:
     """A single nightly benchmark result with embedded config and machine info."""
 
@@ -166,6 +356,18 @@ class NightlyResult:
     trigger: str = (
         "scheduled"  # "scheduled" (nightly cron) or "manual" (workflow_dispatch)
     )
+    # Commit date as a day number, derived from date for cheap ordering
+    day: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            day = date.fromisoformat(self.date).toordinal()
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Invalid date {self.date!r} for nightly result {self.commit}, "
+                "expected YYYY-MM-DD"
+            ) from None
+        object.__setattr__(self, "day", day)
 
     @property
     def dbcache(self) -> int:
@@ -210,19 +412,27 @@ class NightlyResult:
         """
         # Check if this is the new format (has config as dict)
         if isinstance(data.get("config"), dict):
-            return cls(
-                date=data["date"],
-                commit=data["commit"],
-                mean=data["mean"],
-                stddev=data["stddev"],
-                runs=data["runs"],
-                config=data["config"],
-                machine=data.get("machine", {}),
-                run_date=data.get("run_date", ""),
-                trigger=data.get("trigger", "scheduled"),
-            )
+            return cls._from_current(data)
+        return cls._from_legacy(data)
+
+    @classmethod
+    def _from_current(cls, data: dict[str, Any]) -> NightlyResult:
+        """Create from a dictionary with embedded config and machine dicts."""
+        return cls(
+            date=data["date"],
+            commit=data["commit"],
+            mean=data["mean"],
+            stddev=data["stddev"],
+            runs=data["runs"],
+            config=data["config"],
+            machine=data.get("machine", {}),
+            run_date=data.get("run_date", ""),
+            trigger=data.get("trigger", "scheduled"),
+        )
 
-        # Legacy format - convert to new format
+    @classmethod
+    def _from_legacy(cls, data: dict[str, Any]) -> NightlyResult:
+        """Create from a legacy dictionary, converting it to the new format."""
         dbcache = data.get("dbcache", 0)
         return cls(
             date=data["date"],
@@ -239,35 +449,182 @@ class NightlyResult:
         )
 
 
+def _intern(pool: dict[bytes, dict[str, Any]], value: Any) -> Any:
+    """Return a shared instance of a dict equal to value.
+
+    Nightly rows from the same machine and experiment profile carry identical
+    config and machine snapshots, so loading shares one dict per distinct
+    snapshot instead of keeping a copy per row.
+    """
+    if not isinstance(value, dict):
+        return value
+    return pool.setdefault(jsonio.dumps(value, sort_keys=True), value)
+
+
+def _history_sort_key(result: NightlyResult) -> tuple[int, Any, str]:
+    """Order results by date, then config identity."""
+    return (result.day, result.dbcache, result.instrumentation)
+
+
+def _remove_sorted(results: list[NightlyResult], result: NightlyResult) -> None:
+    """Remove a result from a list sorted by _history_sort_key.
+
+    Bisects to the result's sort key and matches by identity, avoiding the
+    linear scan and field-by-field comparisons of list.remove().
+    """
+    i = bisect.bisect_left(results, _history_sort_key(result), key=_history_sort_key)
+    while results[i] is not result:
+        i += 1
+    del results[i]
+
+
 class NightlyHistory:
     """Manages the nightly benchmark history stored in JSON.
 
     Each result is self-contained with its own config and machine info.
+    A history file ending in ``.gz`` is read and written gzip-compressed.
+
+    A ``.jsonl`` history holds one result per line and is append-only:
+    retried scheduled runs are resolved when the file is loaded, so with
+    ``append_only=True`` new results can be added without reading it.
     """
 
-    def __init__(self, history_file: Path):
+    def __init__(self, history_file: Path, append_only: bool = False):
         self.history_file = history_file
+        # Only line-oriented files can be extended without a full rewrite
+        self.append_only = append_only and self._jsonl
         self.results: list[NightlyResult] = []
-        self._load()
+        # Results appended since load, written out by an append-only save()
+        self._unsaved: list[NightlyResult] = []
+        self._chart_data: list[dict] | None = None
+        # Scheduled results by retry-dedup key, kept in sync by append()
+        self._scheduled: dict[tuple[str, str, Any, str], NightlyResult] = {}
+        # Results per dbcache in history order, built lazily on first query
+        self._by_dbcache: dict[Any, list[NightlyResult]] | None = None
+        if not self.append_only:
+            self._load()
+
+    @staticmethod
+    def _dedup_key(result: NightlyResult) -> tuple[str, str, Any, str]:
+        """Identity of a scheduled run, used to replace retried results."""
+        return (result.date, result.commit, result.dbcache, result.instrumentation)
 
     def _load(self) -> None:
         """Load history from JSON file."""
         if self.history_file.exists():
-            with open(self.history_file) as f:
-                data = json.load(f)
-            self.results = [NightlyResult.from_dict(r) for r in data.get("results", [])]
+            raw = self.history_file.read_bytes()
+            if self._compressed:
+                raw = gzip.decompress(raw)
+            if self._jsonl:
+                rows = [jsonio.loads(line) for line in raw.splitlines() if line.strip()]
+            else:
+                rows = jsonio.loads(raw).get("results", [])
+            config_pool: dict[bytes, dict[str, Any]] = {}
+            machine_pool: dict[bytes, dict[str, Any]] = {}
+            # Note the format while interning, so a fully migrated file skips
+            # the per-row format check in from_dict()
+            current = True
+            for row in rows:
+                config = row.get("config")
+                if isinstance(config, dict):
+                    row["config"] = _intern(config_pool, config)
+                else:
+                    current = False
+                if "machine" in row:
+                    row["machine"] = _intern(machine_pool, row["machine"])
+                # Every profile run on a night shares its date and commit
+                row["date"] = sys.intern(row["date"])
+                row["commit"] = sys.intern(row["commit"])
+            from_row = (
+                NightlyResult._from_current if current else NightlyResult.from_dict
+            )
+            self.results = [from_row(r) for r in rows]
+            if self._jsonl:
+                self.results = self._drop_replaced(self.results)
+            # append() relies on this ordering to insert with bisect
+            self.results.sort(key=_history_sort_key)
             logger.info(f"Loaded {len(self.results)} results from {self.history_file}")
         else:
             self.results = []
             logger.info(f"No existing history at {self.history_file}")
 
+        self._scheduled = {}
+        for r in self.results:
+            if r.trigger == "scheduled":
+                self._scheduled.setdefault(self._dedup_key(r), r)
+        self._by_dbcache = None
+
+    @property
+    def _compressed(self) -> bool:
+        """Whether the history file is stored gzip-compressed."""
+        return self.history_file.suffix == ".gz"
+
+    @property
+    def _jsonl(self) -> bool:
+        """Whether the history file is stored one result per line."""
+        return ".jsonl" in self.history_file.suffixes
+
+    @classmethod
+    def _drop_replaced(cls, results: list[NightlyResult]) -> list[NightlyResult]:
+        """Keep only the last scheduled result per dedup key, as append() would."""
+        latest = {cls._dedup_key(r): r for r in results if r.trigger == "scheduled"}
+        return [
+            r
+            for r in results
+            if r.trigger != "scheduled" or latest[cls._dedup_key(r)] is r
+        ]
+
+    def _dbcache_index(self) -> dict[Any, list[NightlyResult]]:
+        """Return results grouped by dbcache, preserving history order."""
+        if self._by_dbcache is None:
+            self._by_dbcache = {}
+            for r in self.results:
+                self._by_dbcache.setdefault(r.dbcache, []).append(r)
+        return self._by_dbcache
+
     def save(self) -> None:
-        """Save history to JSON file."""
+        """Save history to JSON file.
+
+        An append-only history only appends the results added since it was
+        opened; otherwise the whole file is rewritten.
+        """
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
-        data: dict = {"results": [r.to_dict() for r in self.results]}
-        with open(self.history_file, "w") as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"Saved {len(self.results)} results to {self.history_file}")
+        results = self._unsaved if self.append_only else self.results
+        with self.history_file.open("ab" if self.append_only else "wb") as f:
+            if self._compressed:
+                # mtime=0 and no embedded name keep committed history
+                # reproducible; appended gzip members decompress as one stream
+                with gzip.GzipFile(
+                    filename="", mode="wb", fileobj=f, compresslevel=6, mtime=0
+                ) as gz:
+                    self._write_results(gz, results)
+            else:
+                self._write_results(f, results)
+        logger.info(f"Saved {len(results)} results to {self.history_file}")
+        self._unsaved = []
+
+    def _write_results(self, f: BinaryIO, results: list[NightlyResult]) -> None:
+        """Stream results to f one record at a time.
+
+        JSON output has the same layout as indenting the whole document, so
+        no encoded copy of the full history is held in memory.
+        """
+        if self._jsonl:
+            for r in results:
+                f.write(jsonio.dumps(r, default=NightlyResult.to_dict) + b"\n")
+            return
+
+        if not results:
+            f.write(b'{\n  "results": []\n}')
+            return
+        f.write(b'{\n  "results": [\n')
+        for i, r in enumerate(results):
+            if i:
+                f.write(b",\n")
+            record = jsonio.dumps(r, indent=True, default=NightlyResult.to_dict)
+            # Encoded strings escape newlines, so these are all line breaks
+            f.write(b"    " + record.replace(b"\n", b"\n    "))
+        f.write(b"\n  ]\n}")
 
     def append(self, result: NightlyResult) -> None:
         """Append a new result to history.
@@ -276,25 +633,29 @@ class NightlyHistory:
         Manual runs are always appended as additional data points.
         """
         if result.trigger == "scheduled":
-            for existing in self.results:
-                if (
-                    existing.trigger == "scheduled"
-                    and existing.date == result.date
-                    and existing.commit == result.commit
-                    and existing.dbcache == result.dbcache
-                    and existing.instrumentation == result.instrumentation
-                ):
-                    logger.warning(
-                        f"Replacing scheduled result for {result.date} "
-                        f"{result.commit[:8]} dbcache={result.dbcache} "
-                        f"{result.instrumentation}"
-                    )
-                    self.results.remove(existing)
-                    break
-
-        self.results.append(result)
-        # Sort by date, then config identity
-        self.results.sort(key=lambda r: (r.date, r.dbcache, r.instrumentation))
+            key = self._dedup_key(result)
+            existing = self._scheduled.get(key)
+            if existing is not None:
+                logger.warning(
+                    f"Replacing scheduled result for {result.date} "
+                    f"{result.commit[:8]} dbcache={result.dbcache} "
+                    f"{result.instrumentation}"
+                )
+                _remove_sorted(self.results, existing)
+                if self._by_dbcache is not None:
+                    _remove_sorted(self._by_dbcache[existing.dbcache], existing)
+            self._scheduled[key] = result
+
+        # Results stay sorted by date, then config identity
+        bisect.insort(self.results, result, key=_history_sort_key)
+        if self._by_dbcache is not None:
+            bisect.insort(
+                self._by_dbcache.setdefault(result.dbcache, []),
+                result,
+                key=_history_sort_key,
+            )
+        self._unsaved.append(result)
+        self._chart_data = None
         logger.info(
             f"Appended result: {result.date} {result.commit[:8]} dbcache={result.dbcache} {result.mean:.1f}s"
         )
@@ -315,7 +676,7 @@ class NightlyHistory:
             except ValueError:
                 return None
 
-        matching = [r for r in self.results if r.dbcache == dbcache]
+        matching = self._dbcache_index().get(dbcache)
         if not matching:
             return None
         # Results are sorted by date, so last one is most recent
@@ -348,10 +709,8 @@ class NightlyHistory:
 
         matching = [
             r
-            for r in self.results
-            if r.dbcache == dbcache
-            and r.instrumentation == instrumentation
-            and r.trigger == "scheduled"
+            for r in self._dbcache_index().get(dbcache, [])
+            if r.instrumentation == instrumentation and r.trigger == "scheduled"
         ]
         if not matching:
             return None
@@ -365,29 +724,49 @@ class NightlyHistory:
             median = sorted_means[mid]
         return median, recent
 
-    def get_chart_data(self) -> list[dict]:
+    def get_chart_data(self, resolution: str = "full") -> list[dict]:
         """Get results in format suitable for chart embedding.
 
-        Returns data with series_key and series_label for dynamic grouping.
-        Also includes legacy 'config' field for backward compatibility.
+        Returns only the fields the chart scripts read, with series_key and
+        series_label for dynamic grouping. The full config and machine dicts
+        are deliberately left out to keep the embedded payload small.
+        The full-resolution data is cached until the next append.
+
+        Args:
+            resolution: 'full' for one point per result, or 'binary' to keep
+                recent results and aggregate older ones into exponentially
+                wider time buckets
         """
+        if resolution == "binary":
+            return _aggregate_binary(self.get_chart_data())
+        if resolution != "full":
+            raise ValueError(f"Unknown chart resolution: {resolution}")
+
+        if self._chart_data is not None:
+            return self._chart_data
+
+        # Series identity depends only on config and machine, which loaded
+        # results share per distinct snapshot, so derive it once per pair
+        series: dict[tuple[int, int], tuple[str, str, int]] = {}
         chart_data = []
         for r in self.results:
-            key = series_key(r)
+            ids = (id(r.config), id(r.machine))
+            if ids not in series:
+                key = series_key(r)
+                series[ids] = (key, series_label(r), series_color_index(key))
+            key, label, color_index = series[ids]
             chart_data.append(
                 {
                     "date": r.date,
                     "commit": r.commit,
                     "mean": r.mean,
                     "stddev": r.stddev,
-                    "config": str(r.dbcache),  # Legacy compatibility
                     "series_key": key,
-                    "series_label": series_label(r),
-                    "color_index": series_color_index(key),
-                    "trigger": r.trigger,
-                    "run_date": r.run_date,
+                    "series_label": label,
+                    "color_index": color_index,
                 }
             )
+        self._chart_data = chart_data
         return chart_data
 
     def append_from_results_json(
@@ -413,8 +792,7 @@ class NightlyHistory:
         if not results_file.exists():
             raise FileNotFoundError(f"Results file not found: {results_file}")
 
-        with open(results_file) as f:
-            data = json.load(f)
+        data = jsonio.loads(results_file.read_bytes())
 
         # Hyperfine output has a "results" array with one entry per command
         # For nightly, we only have one command (master)
@@ -452,13 +830,26 @@ def generate_nightly_chart(history: NightlyHistory, output_file: Path) -> None:
         history: NightlyHistory instance with loaded results
         output_file: Path to write index.html
     """
+    if not history.results:
+        logger.info(f"No nightly results, skipping chart: {output_file}")
+        return
+
     from bench.render import render_template
 
-    chart_data = history.get_chart_data()
-    html = render_template("nightly-chart.html", chart_data=chart_data)
+    traces = build_chart_traces(
+        history.get_chart_data(resolution="binary"), max_points=MAX_CHART_POINTS
+    )
+    content = render_template("nightly-chart.html", traces=traces).encode()
+
+    # Leave an identical page untouched so it isn't republished needlessly
+    if output_file.exists() and output_file.read_bytes() == content:
+        logger.info(f"Nightly chart unchanged: {output_file}")
+        return
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(html)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    tmp_file.write_bytes(content)
+    tmp_file.replace(output_file)
     logger.info(f"Generated nightly chart: {output_file}")
 
 
@@ -467,12 +858,30 @@ class NightlyPhase:
 
     def __init__(self, history_file: Path):
         self.history_file = history_file
+        self._history: NightlyHistory | None = None
+
+    @property
+    def history(self) -> NightlyHistory:
+        """History loaded on first use and shared by later commands."""
+        if self._history is None:
+            self._history = NightlyHistory(self.history_file)
+        return self._history
+
+    def _history_for_append(self) -> NightlyHistory:
+        """History to append to, loading it only when the format requires."""
+        if self._history is not None:
+            return self._history
+        history = NightlyHistory(self.history_file, append_only=True)
+        if not history.append_only:
+            # The whole file was loaded anyway, so keep it for later commands
+            self._history = history
+        return history
 
     def _machine_specs(self, machine_specs_file: Path | None) -> dict[str, Any]:
         """Load or detect machine specs for nightly history entries."""
         if machine_specs_file:
             logger.info(f"Using pre-captured machine specs from {machine_specs_file}")
-            return json.loads(machine_specs_file.read_text())
+            return jsonio.loads(machine_specs_file.read_bytes())
 
         from bench.machine import get_machine_specs
 
@@ -504,7 +913,7 @@ class NightlyPhase:
             machine_specs_file: Path to pre-captured machine specs JSON (optional)
             run_date: When the benchmark was executed (YYYY-MM-DD), for reference
         """
-        history = NightlyHistory(self.history_file)
+        history = self._history_for_append()
         machine_specs = self._machine_specs(machine_specs_file)
 
         # Build benchmark config snapshot for history grouping.
@@ -548,7 +957,7 @@ class NightlyPhase:
         from bench.artifact_store import ArtifactStore
 
         store = ArtifactStore(experiment_dir)
-        history = NightlyHistory(self.history_file)
+        history = self._history_for_append()
         machine_specs = self._machine_specs(machine_specs_file)
 
         appended = 0
@@ -576,5 +985,4 @@ class NightlyPhase:
         Args:
             output_file: Path to write index.html
         """
-        history = NightlyHistory(self.history_file)
-        generate_nightly_chart(history, output_file)
+        generate_nightly_chart(self.history, output_file)
@@ -2,79 +2,115 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import struct
 import subprocess
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Program header type of the segment naming the dynamic linker
+PT_INTERP = 3
 
+# Patching only ever applies on NixOS, which can't change while we run
+IS_NIXOS = Path("/etc/NIXOS").exists()
+
+
+@functools.cache
 def get_nix_interpreter() -> str | None:
     """Get the path to the nix store's dynamic linker.
 
-    Returns None if not on NixOS or can't find it.
+    Returns None if not on NixOS or can't find it. The result is cached, as
+    it cannot change while the process runs.
     """
-    # Check if we're on NixOS
-    if not Path("/etc/NIXOS").exists():
+    if not IS_NIXOS:
         return None
 
     # Find the interpreter from the current glibc
     # We can get this by checking what the current shell uses
-    try:
-        result = subprocess.run(
-            ["patchelf", "--print-interpreter", "/bin/sh"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            interp = result.stdout.strip()
-            if interp and Path(interp).exists():
-                return interp
-    except FileNotFoundError:
-        pass
+    interp = get_binary_interpreter(Path("/bin/sh"))
+    if interp and Path(interp).exists():
+        return interp
 
     return None
 
 
 def get_binary_interpreter(binary: Path) -> str | None:
-    """Get the interpreter (dynamic linker) of a binary."""
+    """Get the interpreter (dynamic linker) of a binary.
+
+    Reads the PT_INTERP segment from the ELF program headers directly rather
+    than running ``patchelf --print-interpreter``. Returns None for files
+    that aren't ELF or have no interpreter (e.g. static binaries).
+    """
     try:
-        result = subprocess.run(
-            ["patchelf", "--print-interpreter", str(binary)],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except FileNotFoundError:
-        logger.debug("patchelf not found")
+        with open(binary, "rb") as f:
+            header = f.read(64)
+            if len(header) < 52 or header[:4] != b"\x7fELF":
+                return None
+            endian = {1: "<", 2: ">"}.get(header[5])
+            if endian is None:
+                return None
+            if header[4] == 2:  # 64-bit
+                (phoff,) = struct.unpack_from(endian + "Q", header, 32)
+                phentsize, phnum = struct.unpack_from(endian + "HH", header, 54)
+                # p_type, p_offset, p_filesz
+                entry = endian + "I4xQ16xQ"
+            elif header[4] == 1:  # 32-bit
+                (phoff,) = struct.unpack_from(endian + "I", header, 28)
+                phentsize, phnum = struct.unpack_from(endian + "HH", header, 42)
+                entry = endian + "II8xI"
+            else:
+                return None
+
+            f.seek(phoff)
+            table = f.read(phentsize * phnum)
+            for i in range(phnum):
+                if (i + 1) * phentsize > len(table):
+                    break
+                p_type, p_offset, p_filesz = struct.unpack_from(
+                    entry, table, i * phentsize
+                )
+                if p_type == PT_INTERP:
+                    f.seek(p_offset)
+                    return f.read(p_filesz).split(b"\0", 1)[0].decode()
+    except (OSError, struct.error, UnicodeDecodeError) as e:
+        logger.debug(f"Could not read ELF interpreter of {binary}: {e}")
     return None
 
 
-def needs_patching(binary: Path) -> bool:
-    """Check if a binary needs to be patched for NixOS.
+def _interpreter_to_patch(binary: Path) -> str | None:
+    """Get the current interpreter of a binary that needs patching for NixOS.
 
-    Returns True if:
-    - We're on NixOS
-    - The binary has a non-nix interpreter (e.g., /lib64/ld-linux-x86-64.so.2)
+    Returns None when no patching is needed: not on NixOS, the interpreter
+    can't be determined, or it is already in the nix store.
     """
-    nix_interp = get_nix_interpreter()
-    if not nix_interp:
+    if not IS_NIXOS or not get_nix_interpreter():
         # Not on NixOS, no patching needed
-        return False
+        return None
 
     binary_interp = get_binary_interpreter(binary)
     if not binary_interp:
         # Can't determine interpreter, assume no patching needed
-        return False
+        return None
 
     # Check if the binary's interpreter is already in the nix store
     if binary_interp.startswith("/nix/store/"):
-        return False
+        return None
 
     # Binary uses a non-nix interpreter (e.g., /lib64/...)
-    return True
+    return binary_interp
+
+
+def needs_patching(binary: Path) -> bool:
+    """Check if a binary needs to be patched for NixOS.
+
+    Returns True if:
+    - We're on NixOS
+    - The binary has a non-nix interpreter (e.g., /lib64/ld-linux-x86-64.so.2)
+    """
+    return _interpreter_to_patch(binary) is not None
 
 
 def patch_binary(binary: Path) -> bool:
@@ -82,7 +118,8 @@ def patch_binary(binary: Path) -> bool:
 
     Returns True if patching was successful or not needed.
     """
-    if not needs_patching(binary):
+    original_interp = _interpreter_to_patch(binary)
+    if original_interp is None:
         logger.debug(f"Binary {binary} does not need patching")
         return True
 
@@ -91,7 +128,6 @@ def patch_binary(binary: Path) -> bool:
         logger.warning("Cannot patch binary: unable to find nix interpreter")
         return False
 
-    original_interp = get_binary_interpreter(binary)
     logger.info(f"Patching binary: {binary}")
     logger.info(f"  Original interpreter: {original_interp}")
     logger.info(f"  New interpreter: {nix_interp}")
@@ -128,8 +164,5 @@ def ensure_binary_runnable(binary: Path) -> bool:
         logger.error(f"Binary not found: {binary}")
         return False
 
-    # Check if patching is needed and do it
-    if needs_patching(binary):
-        return patch_binary(binary)
-
-    return True
+    # Patches only if needed
+    return patch_binary(binary)
@@ -2,19 +2,53 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from bench import jsonio
 
+
+def _tojson_dumps(
+    obj: Any, indent: int | None = None, sort_keys: bool = False, **kwargs: Any
+) -> str:
+    """Serialize chart payloads for the ``tojson`` filter.
+
+    Only the options both jsonio backends support are accepted, so a
+    template asking for anything else fails instead of being ignored.
+    """
+    if kwargs:
+        raise TypeError(f"Unsupported tojson arguments: {', '.join(sorted(kwargs))}")
+    if indent not in (None, 0, 2):
+        raise ValueError(f"Unsupported tojson indent {indent!r}, only 2 is supported")
+    return jsonio.dumps(obj, indent=bool(indent), sort_keys=sort_keys).decode()
+
+
+@functools.cache
 def get_template_env() -> Environment:
-    """Get the Jinja2 environment for rendering templates."""
+    """Get the Jinja2 environment for rendering templates.
+
+    The environment is created once per process so each template is loaded
+    and compiled on first use and reused by later renders. Templates ship
+    with the package and do not change while it runs, so cached templates
+    are not re-checked against their source files.
+    """
     template_dir = Path(__file__).parent / "templates"
-    return Environment(
+    env = Environment(
         loader=FileSystemLoader(template_dir),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        # Don't emit the indentation and newlines around block tags
+        trim_blocks=True,
+        lstrip_blocks=True,
     )
+    # Embedded chart data is consumed by JS, so key order is irrelevant;
+    # skip the default sort_keys and use the fast encoder when available.
+    env.policies["json.dumps_function"] = _tojson_dumps
+    env.policies["json.dumps_kwargs"] = {}
+    return env
 
 
 def render_template(template_name: str, **context: Any) -> str:
@@ -22,3 +56,13 @@ def render_template(template_name: str, **context: Any) -> str:
     env = get_template_env()
     template = env.get_template(template_name)
     return template.render(**context)
+
+
+def write_template(output_file: Path, template_name: str, **context: Any) -> None:
+    """Render a template straight to a file, without building the whole page.
+
+    Rendered chunks are encoded and written as the template produces them.
+    """
+    env = get_template_env()
+    template = env.get_template(template_name)
+    template.stream(**context).dump(str(output_file), encoding="utf-8")
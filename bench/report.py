@@ -5,26 +5,61 @@ Ported from the JavaScript logic in .github/workflows/publish-results.yml.
 
 from __future__ import annotations
 
-import json
 import logging
-import shutil
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Any
 
+from bench import jsonio
 from bench.analyze import HAS_MATPLOTLIB, LogParser, PlotGenerator
 from bench.artifact_store import ArtifactRun, ArtifactStore
 from bench.nightly import (
+    PALETTE,
     NightlyHistory,
+    build_chart_traces,
     series_color_index,
     series_key,
     series_label,
 )
-from bench.render import render_template
+from bench.render import write_template
+from bench.utils import copy_file
 
 logger = logging.getLogger(__name__)
 
+# Each plot worker holds a fully parsed IBD debug.log in memory, so the
+# pool is capped by memory rather than by core count
+MAX_PLOT_WORKERS = 4
+
+
+def _build_pr_point_traces(pr_chart_data: list[dict]) -> list[dict]:
+    """Build one star-marker Plotly trace per PR result, times in minutes."""
+    traces = []
+    for pr in pr_chart_data:
+        label = pr["series_label"]
+        stddev = pr["stddev"] / 60
+        traces.append(
+            {
+                "name": f"{label} (PR)",
+                "x": [pr["date"]],
+                "y": [pr["mean"] / 60],
+                "customdata": [[pr["commit"], stddev]],
+                "hovertemplate": "<b>PR %{text}</b><br>%{y:.1f} min<br>"
+                f"\u00b1%{{customdata[1]:.1f}} min<extra>{label} PR</extra>",
+                "mode": "markers",
+                "marker": {
+                    "symbol": "star",
+                    "size": 16,
+                    "color": PALETTE[pr["color_index"] % len(PALETTE)],
+                    "line": {"color": "#ffffff", "width": 2},
+                },
+                "showlegend": False,
+            }
+        )
+    return traces
+
 
 def format_config_display(
     dbcache: int,
@@ -90,7 +125,7 @@ def parse_profile_name(profile: str) -> tuple[int, str]:
     return dbcache, instrumentation
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkRun:
     """Parsed benchmark run data."""
 
@@ -104,7 +139,7 @@ class BenchmarkRun:
     parameters: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportResult:
     """Result of report generation."""
 
@@ -158,7 +193,7 @@ def _summary_config_label(config: dict[str, Any]) -> str:
 
 def _config_key(config: dict[str, Any]) -> str:
     """Return a stable key for a full benchmark config snapshot."""
-    return json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return jsonio.dumps(config, sort_keys=True).decode()
 
 
 def _extra_bitcoind_args(bitcoind: dict[str, Any]) -> list[tuple[str, Any]]:
@@ -179,6 +214,102 @@ def _extra_bitcoind_args(bitcoind: dict[str, Any]) -> list[tuple[str, Any]]:
     )
 
 
+def _list_file_names(directory: Path) -> set[str]:
+    """Return the names of the files in directory, or an empty set if missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name for e in entries if e.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _plot_list_file(plots_dir: Path, prefix: str) -> Path:
+    """Return the file recording the plots last generated for prefix.
+
+    It is a dotfile so it is not published alongside the plots.
+    """
+    return plots_dir / f".{prefix}-plots.json"
+
+
+def _log_identity(debug_log: Path) -> dict[str, Any]:
+    """Identify a debug.log by its resolved path, size and modification time."""
+    stat = debug_log.stat()
+    return {
+        "path": str(debug_log.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def _plots_up_to_date(plots_dir: Path, prefix: str, debug_log: Path) -> bool:
+    """Check whether plots_dir holds the complete plots generated from debug_log.
+
+    Parsing a full IBD debug.log dominates report time, so re-running a
+    report over the same artifacts reuses the plots already in plots_dir.
+    Which plots exist depends on the log, so a completed plotting run
+    records the log it read and the plots it wrote. They are reused only
+    for that exact log, and only while every listed plot is still present.
+    """
+    try:
+        recorded = jsonio.loads(_plot_list_file(plots_dir, prefix).read_bytes())
+        return recorded["log"] == _log_identity(debug_log) and all(
+            (plots_dir / name).is_file() for name in recorded["plots"]
+        )
+    except (FileNotFoundError, KeyError, TypeError, ValueError):
+        return False
+
+
+def _plot_debug_log(debug_log: Path, prefix: str, plots_dir: Path) -> int:
+    """Parse a debug.log and write its plots, returning how many were written."""
+    plot_list = _plot_list_file(plots_dir, prefix)
+    # Forget the previous plots first so an interrupted run is redone
+    plot_list.unlink(missing_ok=True)
+    log = _log_identity(debug_log)
+    data = LogParser().parse_file(debug_log)
+    plots = PlotGenerator(prefix, plots_dir).generate_all(data)
+    plot_list.write_bytes(jsonio.dumps({"log": log, "plots": [p.name for p in plots]}))
+    return len(plots)
+
+
+def _generate_plots(jobs: list[tuple[Path, str]], plots_dir: Path) -> None:
+    """Generate plots for each (debug_log, prefix) job into plots_dir.
+
+    Logs are independent and parsing one is CPU-bound, so several are
+    handled at once in worker processes; a single log is handled inline.
+    A log whose plots fail is logged and skipped.
+    """
+    pending = []
+    for debug_log, prefix in jobs:
+        if _plots_up_to_date(plots_dir, prefix, debug_log):
+            logger.info(f"Plots for {prefix} are up to date")
+        else:
+            pending.append((debug_log, prefix))
+    if not pending:
+        return
+
+    plots_dir.mkdir(parents=True, exist_ok=True)
+    if len(pending) == 1:
+        debug_log, prefix = pending[0]
+        try:
+            count = _plot_debug_log(debug_log, prefix, plots_dir)
+            logger.info(f"Generated {count} plots for {prefix}")
+        except Exception:
+            logger.warning(f"Failed to generate plots for {prefix}", exc_info=True)
+        return
+
+    workers = min(len(pending), os.cpu_count() or 1, MAX_PLOT_WORKERS)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (prefix, executor.submit(_plot_debug_log, debug_log, prefix, plots_dir))
+            for debug_log, prefix in pending
+        ]
+        for prefix, future in futures:
+            try:
+                logger.info(f"Generated {future.result()} plots for {prefix}")
+            except Exception:
+                logger.warning(f"Failed to generate plots for {prefix}", exc_info=True)
+
+
 def _nightly_comparable_config(config: dict[str, Any]) -> bool:
     """Return whether nightly history currently compares this config exactly."""
     return not _extra_bitcoind_args(config.get("bitcoind", {}))
@@ -220,10 +351,13 @@ def format_comparison_summary(
 
 def format_run_times_summary(runs: list["BenchmarkRun"]) -> str:
     """Format all run times for PR comments."""
-    lines = [
-        f"{_summary_config_label(run.config)}: {run.mean / 60:.1f} min"
-        for run in sorted(runs, key=lambda r: _summary_config_label(r.config))
-    ]
+    # Label each run once and sort on it, rather than labelling in the sort
+    # key and again for the output line
+    labelled = sorted(
+        ((_summary_config_label(run.config), run.mean) for run in runs),
+        key=lambda item: item[0],
+    )
+    lines = [f"{label}: {mean / 60:.1f} min" for label, mean in labelled]
     return "\n- ".join(lines)
 
 
@@ -251,9 +385,12 @@ class ReportGenerator:
         output_dir.mkdir(parents=True, exist_ok=True)
         artifact_store = ArtifactStore(experiment_dir)
         all_runs: list[BenchmarkRun] = []
+        plot_jobs: list[tuple[Path, str]] = []
 
         for run_artifact in artifact_store.load_runs():
-            if not run_artifact.results_file.exists():
+            try:
+                data = jsonio.loads(run_artifact.results_file.read_bytes())
+            except FileNotFoundError:
                 logger.warning(
                     "results.json not found for profile %s at %s",
                     run_artifact.profile,
@@ -261,9 +398,6 @@ class ReportGenerator:
                 )
                 continue
 
-            with open(run_artifact.results_file) as f:
-                data = json.load(f)
-
             for result in data.get("results", []):
                 all_runs.append(
                     BenchmarkRun(
@@ -278,17 +412,23 @@ class ReportGenerator:
                     )
                 )
 
-            self._copy_manifest_artifacts(run_artifact, output_dir)
+            plot_job = self._copy_manifest_artifacts(run_artifact, output_dir)
+            if plot_job:
+                plot_jobs.append(plot_job)
 
         if not all_runs:
             raise ValueError("No benchmark results found in experiment manifest")
 
+        _generate_plots(plot_jobs, output_dir / "plots")
+
         nightly_comparison = self._calculate_nightly_comparison(all_runs, commit)
         full_title = title
         if pr_number and run_id:
             full_title = f"PR #{pr_number} - Run {run_id}"
 
-        html = self._generate_html(
+        index_file = output_dir / "index.html"
+        self._write_html(
+            index_file,
             all_runs,
             nightly_comparison,
             full_title,
@@ -297,9 +437,6 @@ class ReportGenerator:
             commit,
             run_id,
         )
-
-        index_file = output_dir / "index.html"
-        index_file.write_text(html)
         logger.info(f"Generated report: {index_file}")
 
         combined_results: dict[str, Any] = {
@@ -320,7 +457,7 @@ class ReportGenerator:
             combined_results["nightly_comparison"] = nightly_comparison
 
         results_file = output_dir / "results.json"
-        results_file.write_text(json.dumps(combined_results, indent=2))
+        results_file.write_bytes(jsonio.dumps(combined_results, indent=True))
 
         summary_file = output_dir / "summary.txt"
         if nightly_comparison:
@@ -365,11 +502,10 @@ class ReportGenerator:
 
         # Load results.json
         results_file = input_dir / "results.json"
-        if not results_file.exists():
-            raise FileNotFoundError(f"results.json not found in {input_dir}")
-
-        with open(results_file) as f:
-            data = json.load(f)
+        try:
+            data = jsonio.loads(results_file.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"results.json not found in {input_dir}") from None
 
         # Parse results
         runs = self._parse_results(data)
@@ -377,12 +513,9 @@ class ReportGenerator:
         # Copy artifacts first so plots are available for template rendering
         self._copy_artifacts(input_dir, output_dir)
 
-        # Generate HTML (no nightly comparison in single-directory mode)
-        html = self._generate_html(runs, {}, title, input_dir, output_dir)
-
-        # Write report
+        # Write HTML report (no nightly comparison in single-directory mode)
         index_file = output_dir / "index.html"
-        index_file.write_text(html)
+        self._write_html(index_file, runs, {}, title, input_dir, output_dir)
         logger.info(f"Generated report: {index_file}")
 
         return ReportResult(
@@ -405,23 +538,25 @@ class ReportGenerator:
         results = []
 
         if results_dir.exists():
-            for pr_dir in sorted(
-                results_dir.iterdir(),
-                key=lambda d: (0, int(d.name.replace("pr-", "")))
-                if d.name.startswith("pr-") and d.name.replace("pr-", "").isdigit()
-                else (1, d.name),
-            ):
-                if pr_dir.is_dir() and pr_dir.name.startswith("pr-"):
-                    pr_num = pr_dir.name.replace("pr-", "")
-                    pr_runs = []
-                    for run_dir in sorted(pr_dir.iterdir()):
-                        if run_dir.is_dir():
-                            pr_runs.append(run_dir.name)
-                    if pr_runs:
-                        results.append((pr_num, pr_runs))
-
-        html = render_template("results-index.html", results=results)
-        output_file.write_text(html)
+            # scandir entries know their type from the directory listing,
+            # so is_dir() needs no extra stat() per entry
+            with os.scandir(results_dir) as entries:
+                pr_dirs = [
+                    (e.name.removeprefix("pr-"), e.path)
+                    for e in entries
+                    if e.name.startswith("pr-") and e.is_dir()
+                ]
+            # Numbered PRs first in numeric order, then anything else by name
+            pr_dirs.sort(
+                key=lambda d: (0, int(d[0])) if d[0].isdigit() else (1, d[0])
+            )
+            for pr_num, pr_path in pr_dirs:
+                with os.scandir(pr_path) as entries:
+                    pr_runs = sorted(e.name for e in entries if e.is_dir())
+                if pr_runs:
+                    results.append((pr_num, pr_runs))
+
+        write_template(output_file, "results-index.html", results=results)
         logger.info(f"Generated index: {output_file}")
 
     def _parse_results(self, data: dict) -> list[BenchmarkRun]:
@@ -538,11 +673,15 @@ class ReportGenerator:
         self,
         run_artifact: ArtifactRun,
         output_dir: Path,
-    ) -> None:
-        """Copy artifacts listed in an experiment manifest run record."""
+    ) -> tuple[Path, str] | None:
+        """Copy artifacts listed in an experiment manifest run record.
+
+        Returns:
+            The (debug_log, plot prefix) to generate plots for, if any
+        """
         if run_artifact.flamegraph and run_artifact.flamegraph.exists():
             dest = output_dir / f"{run_artifact.profile}-{run_artifact.flamegraph.name}"
-            shutil.copy2(run_artifact.flamegraph, dest)
+            copy_file(run_artifact.flamegraph, dest)
             logger.debug(f"Copied {run_artifact.flamegraph.name} as {dest.name}")
 
         if (
@@ -551,18 +690,12 @@ class ReportGenerator:
             and run_artifact.debug_log.exists()
         ):
             name = run_artifact.debug_log.name.removesuffix("-debug.log")
-            prefix = f"{run_artifact.profile}-{name}"
-            plots_dir = output_dir / "plots"
-            plots_dir.mkdir(parents=True, exist_ok=True)
-            try:
-                data = LogParser().parse_file(run_artifact.debug_log)
-                plots = PlotGenerator(prefix, plots_dir).generate_all(data)
-                logger.info(f"Generated {len(plots)} plots for {prefix}")
-            except Exception:
-                logger.warning(f"Failed to generate plots for {prefix}", exc_info=True)
+            return run_artifact.debug_log, f"{run_artifact.profile}-{name}"
+        return None
 
-    def _generate_html(
+    def _write_html(
         self,
+        index_file: Path,
         runs: list[BenchmarkRun],
         nightly_comparison: dict[str, dict[str, Any]],
         title: str,
@@ -570,8 +703,8 @@ class ReportGenerator:
         output_dir: Path,
         commit: str | None = None,
         run_id: str | None = None,
-    ) -> str:
-        """Generate the HTML report."""
+    ) -> None:
+        """Write the HTML report to index_file."""
         sorted_runs = sorted(runs, key=lambda r: r.profile)
 
         runs_data = []
@@ -592,19 +725,21 @@ class ReportGenerator:
 
         graphs = self._prepare_graphs_data(runs, input_dir, output_dir)
 
-        nightly_chart_data = None
+        pr_chart_traces = None
         if pr_chart_data and self.nightly_history:
-            nightly_chart_data = self.nightly_history.get_chart_data()
+            pr_chart_traces = build_chart_traces(
+                self.nightly_history.get_chart_data(), source="nightly", marker_size=6
+            ) + _build_pr_point_traces(pr_chart_data)
 
         ci_run_url = f"{self.repo_url}/actions/runs/{run_id}" if run_id else None
 
-        return render_template(
+        write_template(
+            index_file,
             "pr-report.html",
             title=title,
             runs=runs_data,
             nightly_comparison=nightly_data,
-            pr_chart_data=pr_chart_data,
-            nightly_chart_data=nightly_chart_data,
+            pr_chart_traces=pr_chart_traces,
             graphs=graphs,
             repo_url=self.repo_url,
             ci_run_url=ci_run_url,
@@ -658,6 +793,15 @@ class ReportGenerator:
         """Prepare flamegraphs and debug logs data for template rendering."""
         graphs = []
 
+        # List each directory once up front instead of probing per run
+        output_names = _list_file_names(output_dir)
+        input_names = (
+            output_names if input_dir == output_dir else _list_file_names(input_dir)
+        )
+        plot_names = sorted(
+            n for n in _list_file_names(output_dir / "plots") if n.endswith(".png")
+        )
+
         for run in runs:
             name = run.command
             profile = run.profile
@@ -666,19 +810,16 @@ class ReportGenerator:
             profile_prefixed = f"{profile}-{name}-flamegraph.svg"
             non_prefixed = f"{name}-flamegraph.svg"
 
-            if (output_dir / profile_prefixed).exists():
+            if profile_prefixed in output_names:
                 flamegraph_name = profile_prefixed
-            elif (input_dir / non_prefixed).exists():
+            elif non_prefixed in input_names:
                 flamegraph_name = non_prefixed
 
             plots = []
-            plots_dir = output_dir / "plots"
-            if plots_dir.exists():
-                for prefix in [f"{profile}-{name}", name]:
-                    plot_files = sorted(plots_dir.glob(f"{prefix}-*.png"))
-                    if plot_files:
-                        plots = [f"plots/{p.name}" for p in plot_files]
-                        break
+            for prefix in [f"{profile}-{name}-", f"{name}-"]:
+                plots = [f"plots/{n}" for n in plot_names if n.startswith(prefix)]
+                if plots:
+                    break
 
             if not flamegraph_name and not plots:
                 continue
@@ -697,27 +838,23 @@ class ReportGenerator:
 
     def _copy_artifacts(self, input_dir: Path, output_dir: Path) -> None:
         """Copy flamegraphs and generate plots from debug logs."""
-        same_dir = input_dir.resolve() == output_dir.resolve()
+        try:
+            same_dir = os.path.samefile(input_dir, output_dir)
+        except FileNotFoundError:
+            same_dir = False
 
         if not same_dir:
             for svg in input_dir.glob("*-flamegraph.svg"):
                 dest = output_dir / svg.name
-                shutil.copy2(svg, dest)
+                copy_file(svg, dest)
                 logger.debug(f"Copied {svg.name}")
 
         if HAS_MATPLOTLIB:
-            for log in input_dir.glob("*-debug.log"):
-                name = log.name.removesuffix("-debug.log")
-                plots_dir = output_dir / "plots"
-                plots_dir.mkdir(parents=True, exist_ok=True)
-                try:
-                    data = LogParser().parse_file(log)
-                    plots = PlotGenerator(name, plots_dir).generate_all(data)
-                    logger.info(f"Generated {len(plots)} plots for {name}")
-                except Exception:
-                    logger.warning(
-                        f"Failed to generate plots for {name}", exc_info=True
-                    )
+            plot_jobs = [
+                (log, log.name.removesuffix("-debug.log"))
+                for log in input_dir.glob("*-debug.log")
+            ]
+            _generate_plots(plot_jobs, output_dir / "plots")
 
 
 class ReportPhase:
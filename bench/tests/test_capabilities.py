@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bench.capabilities import _can_write_drop_caches
+
+
+class DropCachesProbeTests(unittest.TestCase):
+    def test_probe_neither_creates_nor_truncates(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            proc = Path(temp_dir) / "drop_caches"
+
+            with mock.patch("bench.capabilities.DROP_CACHES_PROC", str(proc)):
+                self.assertFalse(_can_write_drop_caches())
+                self.assertFalse(proc.exists())
+
+                proc.write_text("0\n")
+                self.assertTrue(_can_write_drop_caches())
+                self.assertEqual(proc.read_text(), "0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
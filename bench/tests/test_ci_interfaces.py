@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest import mock
 
+from bench.analyze import HAS_MATPLOTLIB
 from bench.artifact_store import ArtifactStore
 from bench.nightly import NightlyHistory, NightlyPhase
-from bench.report import ReportGenerator
+from bench.report import (
+    MAX_PLOT_WORKERS,
+    BenchmarkRun,
+    ReportGenerator,
+    _generate_plots,
+    _plots_up_to_date,
+)
 
 
 def _write_json(path: Path, data: dict) -> None:
@@ -190,6 +200,170 @@ class CiInterfaceTests(unittest.TestCase):
                 450,
             )
 
+    def test_index_lists_pr_runs_in_numeric_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_dir = Path(temp_dir) / "results"
+            for run_dir in ("pr-10/b", "pr-10/a", "pr-2/c", "pr-3", "pr-x/d", "misc/e"):
+                (results_dir / run_dir).mkdir(parents=True)
+            (results_dir / "pr-4").write_text("")
+            output_file = Path(temp_dir) / "index.html"
+
+            ReportGenerator().generate_index(results_dir, output_file)
+
+            html = output_file.read_text()
+            positions = [
+                html.index(f"pr-{run}/index.html")
+                for run in ("2/c", "10/a", "10/b", "x/d")
+            ]
+            self.assertEqual(positions, sorted(positions))
+            self.assertNotIn("PR #3", html)
+            self.assertNotIn("misc", html)
+
+    def test_graphs_pick_flamegraphs_and_plots_per_run(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            (output_dir / "plots").mkdir()
+            for name in (
+                "450-head-flamegraph.svg",
+                "plots/450-head-b.png",
+                "plots/450-head-a.png",
+                "plots/base-a.png",
+                "plots/base-notes.txt",
+            ):
+                (output_dir / name).write_text("")
+            runs = [
+                BenchmarkRun(profile, {}, command, 1.0, None, 1.0, 1.0)
+                for profile, command in (
+                    ("450", "head"),
+                    ("450", "base"),
+                    ("450", "other"),
+                )
+            ]
+
+            graphs = ReportGenerator()._prepare_graphs_data(
+                runs, output_dir, output_dir
+            )
+
+            self.assertEqual(
+                graphs,
+                [
+                    {
+                        "label": "450 - head",
+                        "flamegraph": "450-head-flamegraph.svg",
+                        "plots": ["plots/450-head-a.png", "plots/450-head-b.png"],
+                    },
+                    {
+                        "label": "450 - base",
+                        "flamegraph": None,
+                        "plots": ["plots/base-a.png"],
+                    },
+                ],
+            )
+
+    def test_plots_from_the_same_debug_log_are_up_to_date(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            log = root / "head-debug.log"
+            log.write_text("UpdateTip\n")
+            os.utime(log, ns=(2_000, 2_000))
+            plots_dir = root / "plots"
+
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+
+            plots_dir.mkdir()
+            names = ["450-head-height_vs_time.png", "450-head-cache_vs_time.png"]
+            for name in names:
+                (plots_dir / name).write_text("")
+            # Plots without the list written last are from an interrupted run
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+
+            plot_list = plots_dir / ".450-head-plots.json"
+
+            def record(size: int, mtime_ns: int, plots: list[str], path=log) -> None:
+                source = {
+                    "path": str(path.resolve()),
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                }
+                plot_list.write_text(json.dumps({"log": source, "plots": plots}))
+
+            record(10, 2_000, names)
+            self.assertTrue(_plots_up_to_date(plots_dir, "450-head", log))
+            # Names are matched exactly, not by a shared prefix
+            self.assertFalse(_plots_up_to_date(plots_dir, "450", log))
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-base", log))
+
+            # A different log copied in with an older mtime is not reused
+            record(10, 3_000, names)
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+            record(11, 2_000, names)
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+            record(10, 2_000, names, path=root / "base-debug.log")
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+            record(10, 2_000, names)
+            self.assertTrue(_plots_up_to_date(plots_dir, "450-head", log))
+
+            (plots_dir / names[1]).unlink()
+            self.assertFalse(_plots_up_to_date(plots_dir, "450-head", log))
+            record(10, 2_000, names[:1])
+            self.assertTrue(_plots_up_to_date(plots_dir, "450-head", log))
+
+    def test_generate_plots_logs_failures_per_debug_log(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            jobs = []
+            for prefix in ("450-head", "450-base"):
+                log = root / f"{prefix}-debug.log"
+                log.write_text("")
+                jobs.append((log, prefix))
+
+            with self.assertLogs("bench.report") as logs:
+                _generate_plots(jobs, root / "plots")
+
+            messages = "\n".join(logs.output)
+            self.assertTrue((root / "plots").is_dir())
+            # Only plots are published, the plot lists are hidden
+            self.assertEqual(
+                [n for n in os.listdir(root / "plots") if not n.startswith(".")], []
+            )
+            for _, prefix in jobs:
+                if HAS_MATPLOTLIB:
+                    self.assertIn(f"Generated 0 plots for {prefix}", messages)
+                else:
+                    self.assertIn(f"Failed to generate plots for {prefix}", messages)
+
+            # A completed run is reused, a failed one is retried
+            with self.assertLogs("bench.report") as logs:
+                _generate_plots(jobs, root / "plots")
+
+            messages = "\n".join(logs.output)
+            for _, prefix in jobs:
+                self.assertEqual(
+                    f"Plots for {prefix} are up to date" in messages, HAS_MATPLOTLIB
+                )
+
+    def test_generate_plots_caps_workers_and_runs_one_log_inline(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            jobs = []
+            for i in range(MAX_PLOT_WORKERS + 2):
+                log = root / f"{i}-debug.log"
+                log.write_text("")
+                jobs.append((log, str(i)))
+
+            with (
+                mock.patch("bench.report.os.cpu_count", return_value=64),
+                mock.patch(
+                    "bench.report.ProcessPoolExecutor", wraps=ThreadPoolExecutor
+                ) as pool,
+                self.assertLogs("bench.report"),
+            ):
+                _generate_plots(jobs[:1], root / "plots")
+                pool.assert_not_called()
+
+                _generate_plots(jobs, root / "plots")
+                pool.assert_called_once_with(max_workers=MAX_PLOT_WORKERS)
+
 
 if __name__ == "__main__":
     unittest.main()
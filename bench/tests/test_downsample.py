@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import unittest
+
+from bench.downsample import lttb
+
+
+class LttbTests(unittest.TestCase):
+    def test_short_series_is_kept_whole(self) -> None:
+        self.assertEqual(lttb([0, 1, 2], [5, 6, 7], threshold=10), [0, 1, 2])
+
+    def test_keeps_endpoints_and_spike(self) -> None:
+        x = list(range(100))
+        y = [10.0] * 100
+        y[42] = 50.0
+
+        selected = lttb(x, y, threshold=10)
+
+        self.assertEqual(len(selected), 10)
+        self.assertEqual(selected[0], 0)
+        self.assertEqual(selected[-1], 99)
+        self.assertIn(42, selected)
+        self.assertEqual(selected, sorted(selected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import unittest
+from dataclasses import dataclass
+from unittest import mock
+
+from bench import jsonio
+
+
+@dataclass
+class _Record:
+    name: str
+    hidden: int = 0
+
+    def to_dict(self) -> dict:
+        return {"name": self.name}
+
+
+def _stdlib_dumps(obj, **kwargs) -> bytes:
+    with mock.patch.object(jsonio, "HAS_ORJSON", False):
+        return jsonio.dumps(obj, **kwargs)
+
+
+class DumpsTests(unittest.TestCase):
+    def test_dataclass_goes_through_default(self) -> None:
+        encoded = _stdlib_dumps([_Record("a", 1)], default=_Record.to_dict)
+
+        self.assertEqual(jsonio.loads(encoded), [{"name": "a"}])
+
+    def test_stdlib_fallback_is_compact_like_orjson(self) -> None:
+        config = {"b": [1, 2], "a": {"dbcache": 450}}
+
+        self.assertEqual(
+            _stdlib_dumps(config, sort_keys=True),
+            b'{"a":{"dbcache":450},"b":[1,2]}',
+        )
+        self.assertEqual(
+            _stdlib_dumps(config, indent=True),
+            b'{\n  "b": [\n    1,\n    2\n  ],\n  "a": {\n    "dbcache": 450\n  }\n}',
+        )
+
+    def test_stdlib_fallback_writes_non_ascii_as_utf8(self) -> None:
+        self.assertEqual(
+            _stdlib_dumps({"cpu": "Zürich ✓"}),
+            '{"cpu":"Zürich ✓"}'.encode(),
+        )
+
+    @unittest.skipUnless(jsonio.HAS_ORJSON, "orjson not installed")
+    def test_backends_produce_identical_bytes(self) -> None:
+        config = {"b": [1, 2.5, None, True], "a": {"dbcache": 450}, "c": "Zürich ✓"}
+        for indent in (False, True):
+            for sort_keys in (False, True):
+                with self.subTest(indent=indent, sort_keys=sort_keys):
+                    self.assertEqual(
+                        jsonio.dumps(config, indent=indent, sort_keys=sort_keys),
+                        _stdlib_dumps(config, indent=indent, sort_keys=sort_keys),
+                    )
+
+    @unittest.skipUnless(jsonio.HAS_ORJSON, "orjson not installed")
+    def test_orjson_passes_dataclasses_to_default(self) -> None:
+        records = [_Record("a", 1), _Record("b", 2)]
+        for indent in (False, True):
+            with self.subTest(indent=indent):
+                encoded = jsonio.dumps(records, indent=indent, default=_Record.to_dict)
+
+                self.assertEqual(jsonio.loads(encoded), [{"name": "a"}, {"name": "b"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
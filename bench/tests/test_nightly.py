@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+from bench import jsonio
+from bench.nightly import (
+    NightlyHistory,
+    NightlyPhase,
+    NightlyResult,
+    _aggregate_binary,
+    build_chart_traces,
+    generate_nightly_chart,
+)
+
+
+def _point(day: date, mean: float, commit: str, key: str = "series") -> dict:
+    return {
+        "date": day.isoformat(),
+        "commit": commit,
+        "mean": mean,
+        "stddev": 2.0,
+        "series_key": key,
+        "series_label": key,
+        "color_index": 0,
+    }
+
+
+class AggregateBinaryTests(unittest.TestCase):
+    def test_keeps_recent_points_and_buckets_old_ones(self) -> None:
+        newest = date(2026, 6, 30)
+        recent = [_point(newest - timedelta(days=i), 100, f"r{i}") for i in range(5)]
+        old = [
+            _point(newest - timedelta(days=28), 200, "old-a"),
+            _point(newest - timedelta(days=29), 100, "old-b"),
+        ]
+
+        result = _aggregate_binary(old + recent)
+
+        self.assertEqual(len(result), len(recent) + 1)
+        bucket = result[0]
+        self.assertEqual(bucket["commit"], "")
+        self.assertEqual(bucket["aggregated"], 2)
+        self.assertEqual(bucket["first_date"], "2026-06-01")
+        self.assertEqual(bucket["last_date"], "2026-06-02")
+        self.assertEqual(bucket["mean"], 150)
+        self.assertAlmostEqual(bucket["stddev"], 2.0)
+        self.assertEqual([d["date"] for d in result], sorted(d["date"] for d in result))
+
+    def test_buckets_do_not_shift_as_history_grows(self) -> None:
+        newest = date(2026, 6, 30)
+        old = [
+            _point(newest - timedelta(days=age), 100 + age, f"c{age}")
+            for age in range(60, 101)
+        ]
+
+        tonight = _aggregate_binary([*old, _point(newest, 100, "head")])
+        tomorrow = _aggregate_binary(
+            [*old, _point(newest, 100, "head"), _point(newest + timedelta(1), 1, "n")]
+        )
+
+        buckets = [d for d in tonight if d.get("aggregated")]
+        self.assertGreater(len(buckets), 1)
+        self.assertEqual(buckets, [d for d in tomorrow if d.get("aggregated")])
+
+    def test_does_not_merge_different_series(self) -> None:
+        newest = date(2026, 6, 30)
+        old_day = newest - timedelta(days=60)
+        points = [
+            _point(newest, 100, "head"),
+            _point(old_day, 100, "a", key="small"),
+            _point(old_day, 50, "b", key="large"),
+        ]
+
+        result = _aggregate_binary(points)
+
+        self.assertEqual(len(result), 3)
+
+
+class BuildChartTracesTests(unittest.TestCase):
+    def test_groups_series_sorted_by_label_and_date_in_minutes(self) -> None:
+        day = date(2026, 6, 1)
+        points = [
+            _point(day + timedelta(days=1), 120, "b" * 40, key="zeta"),
+            _point(day, 60, "a" * 40, key="zeta"),
+            _point(day, 180, "c" * 40, key="alpha"),
+        ]
+
+        traces = build_chart_traces(points)
+
+        self.assertEqual([t["name"] for t in traces], ["alpha", "zeta"])
+        zeta = traces[1]
+        self.assertEqual(zeta["x"], ["2026-06-01", "2026-06-02"])
+        self.assertEqual(zeta["y"], [1, 2])
+        self.assertEqual(zeta["customdata"][0], ["a" * 40, 2.0 / 60])
+        self.assertNotIn("text", zeta)
+        self.assertEqual(zeta["line"]["color"], "#3B4CC0")
+        self.assertEqual(zeta["error_y"]["color"], "rgba(59, 76, 192, 0.3)")
+
+    def test_aggregated_points_have_summary_and_distinct_marker(self) -> None:
+        newest = date(2026, 6, 30)
+        points = [
+            _point(newest - timedelta(days=29), 120, "old"),
+            _point(newest, 60, "head"),
+        ]
+
+        (trace,) = build_chart_traces(_aggregate_binary(points))
+
+        self.assertEqual(
+            trace["customdata"][0],
+            ["", 2.0 / 60, "Mean of 1 nightly run, 2026-06-01 to 2026-06-01"],
+        )
+        self.assertEqual(trace["customdata"][1], ["head", 2.0 / 60])
+        self.assertEqual(trace["marker"]["symbol"], ["diamond-open", "circle"])
+
+    def test_downsamples_long_series(self) -> None:
+        day = date(2026, 1, 1)
+        points = [_point(day + timedelta(days=i), 60, f"c{i}") for i in range(50)]
+
+        (trace,) = build_chart_traces(points, max_points=10)
+
+        self.assertEqual(len(trace["x"]), 10)
+        self.assertEqual(len(trace["error_y"]["array"]), 10)
+        self.assertEqual(trace["customdata"][-1][0], "c49")
+
+
+def _result(day: str, dbcache: int, mean: float, trigger: str = "scheduled"):
+    return NightlyResult(
+        date=day,
+        commit="abc123",
+        mean=mean,
+        stddev=1.0,
+        runs=2,
+        config={"bitcoind": {"dbcache": dbcache}, "instrumentation": "uninstrumented"},
+        machine={},
+        trigger=trigger,
+    )
+
+
+# Exercise the stdlib fallback always and orjson wherever it is installed.
+_JSON_BACKENDS = (False, True) if jsonio.HAS_ORJSON else (False,)
+
+
+class NightlyHistoryTests(unittest.TestCase):
+    def test_append_replaces_scheduled_retry_and_keeps_manual(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = NightlyHistory(Path(temp_dir) / "history.json")
+            history.append(_result("2026-06-01", 450, 100))
+            history.append(_result("2026-06-01", 450, 90))
+            history.append(_result("2026-06-01", 450, 80, trigger="manual"))
+            history.append(_result("2026-06-02", 32000, 70))
+
+            self.assertEqual([r.mean for r in history.results], [90, 80, 70])
+            self.assertEqual(history.get_latest(450).mean, 80)
+            self.assertEqual(history.get_latest("32000").mean, 70)
+            self.assertIsNone(history.get_latest(1000))
+            self.assertEqual(history.get_recent_median(450), (90, history.results[:1]))
+
+            history.append(_result("2026-06-03", 450, 60))
+            history.append(_result("2026-05-31", 450, 50))
+            self.assertEqual(
+                [r.date for r in history.results],
+                ["2026-05-31", "2026-06-01", "2026-06-01", "2026-06-02", "2026-06-03"],
+            )
+            self.assertEqual(history.get_latest(450).mean, 60)
+            self.assertEqual(history.results[0].day, date(2026, 5, 31).toordinal())
+
+    def test_load_shares_identical_config_and_machine_dicts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.json"
+            history = NightlyHistory(history_file)
+            history.append(_result("2026-06-01", 450, 100))
+            history.append(_result("2026-06-02", 450, 90))
+            history.append(_result("2026-06-02", 32000, 70))
+            history.save()
+
+            first, second, third = NightlyHistory(history_file).results
+
+            self.assertIs(first.config, second.config)
+            self.assertIsNot(first.config, third.config)
+            self.assertIs(first.machine, third.machine)
+            self.assertIs(second.date, third.date)
+            self.assertIs(first.commit, third.commit)
+
+    def test_chart_data_series_follow_each_results_config(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.json"
+            history = NightlyHistory(history_file)
+            history.append(_result("2026-06-01", 450, 100))
+            history.append(_result("2026-06-02", 32000, 90))
+            history.append(_result("2026-06-03", 450, 80))
+            history.save()
+
+            chart_data = NightlyHistory(history_file).get_chart_data()
+
+            keys = [d["series_key"] for d in chart_data]
+            self.assertEqual(keys[0], keys[2])
+            self.assertNotEqual(keys[0], keys[1])
+            self.assertIn("dbcache 32000", chart_data[1]["series_label"])
+
+    def test_save_matches_indented_document_layout(self) -> None:
+        for has_orjson in _JSON_BACKENDS:
+            with (
+                self.subTest(has_orjson=has_orjson),
+                mock.patch.object(jsonio, "HAS_ORJSON", has_orjson),
+                tempfile.TemporaryDirectory() as temp_dir,
+            ):
+                history_file = Path(temp_dir) / "history.json"
+                history = NightlyHistory(history_file)
+                history.save()
+                self.assertEqual(json.loads(history_file.read_text()), {"results": []})
+
+                history.append(_result("2026-06-01", 450, 100))
+                history.append(_result("2026-06-02", 32000, 90))
+                history.save()
+
+                expected = json.dumps(
+                    {"results": [r.to_dict() for r in history.results]}, indent=2
+                )
+                self.assertEqual(history_file.read_text(), expected)
+                for row in json.loads(history_file.read_text())["results"]:
+                    self.assertNotIn("day", row)
+
+    def test_load_converts_legacy_rows_in_mixed_history(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.json"
+            history = NightlyHistory(history_file)
+            history.append(_result("2026-06-02", 450, 100))
+            rows = [r.to_dict() for r in history.results]
+            rows.append(
+                {
+                    "date": "2026-06-01",
+                    "commit": "def456",
+                    "mean": 90,
+                    "stddev": 1.0,
+                    "runs": 2,
+                    "config": "32000",
+                    "dbcache": 32000,
+                }
+            )
+            history_file.write_text(json.dumps({"results": rows}))
+
+            legacy, current = NightlyHistory(history_file).results
+
+            self.assertEqual(legacy.dbcache, 32000)
+            self.assertEqual(legacy.machine, {})
+            self.assertEqual(current, history.results[0])
+
+    def test_load_rejects_malformed_date_clearly(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.json"
+            row = _result("2026-06-01", 450, 100).to_dict()
+            row["date"] = "06/01/2026"
+            history_file.write_text(json.dumps({"results": [row]}))
+
+            with self.assertRaisesRegex(ValueError, r"'06/01/2026'.*YYYY-MM-DD"):
+                NightlyHistory(history_file)
+
+    def test_gz_history_round_trips_compressed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.json.gz"
+            history = NightlyHistory(history_file)
+            history.append(_result("2026-06-01", 450, 100))
+            history.save()
+
+            self.assertEqual(history_file.read_bytes()[:2], b"\x1f\x8b")
+            loaded = NightlyHistory(history_file)
+            self.assertEqual(loaded.results, history.results)
+
+    def test_jsonl_history_appends_without_loading(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_file = Path(temp_dir) / "history.jsonl"
+            for result in (
+                _result("2026-06-02", 450, 100),
+                _result("2026-06-01", 450, 90),
+                _result("2026-06-02", 450, 80),
+            ):
+                history = NightlyHistory(history_file, append_only=True)
+                self.assertEqual(history.results, [])
+                history.append(result)
+                history.save()
+
+            self.assertEqual(len(history_file.read_text().splitlines()), 3)
+            loaded = NightlyHistory(history_file)
+            self.assertEqual([r.mean for r in loaded.results], [90, 80])
+
+            loaded.save()
+            self.assertEqual(len(history_file.read_text().splitlines()), 2)
+
+
+class NightlyPhaseTests(unittest.TestCase):
+    def test_append_and_chart_share_one_loaded_history(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            results_file = temp / "results.json"
+            results_file.write_text(
+                json.dumps({"results": [{"mean": 60, "stddev": 1, "times": [59, 61]}]})
+            )
+            machine_file = temp / "machine.json"
+            machine_file.write_text("{}")
+            phase = NightlyPhase(temp / "history.json")
+            history = phase.history
+
+            phase.append(
+                results_file,
+                commit="abc123",
+                dbcache=450,
+                date_str="2026-06-01",
+                machine_specs_file=machine_file,
+            )
+            phase.chart(temp / "index.html")
+
+            self.assertIs(phase.history, history)
+            self.assertEqual(len(history.results), 1)
+            self.assertEqual(len(NightlyHistory(temp / "history.json").results), 1)
+
+
+class GenerateNightlyChartTests(unittest.TestCase):
+    def test_empty_history_writes_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = NightlyHistory(Path(temp_dir) / "history.json")
+            output_file = Path(temp_dir) / "site" / "index.html"
+
+            generate_nightly_chart(history, output_file)
+
+            self.assertFalse(output_file.parent.exists())
+
+    def test_unchanged_chart_is_not_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = NightlyHistory(Path(temp_dir) / "history.json")
+            history.append(_result("2026-06-01", 450, 100))
+            output_file = Path(temp_dir) / "site" / "index.html"
+
+            generate_nightly_chart(history, output_file)
+            os.utime(output_file, ns=(0, 0))
+            generate_nightly_chart(history, output_file)
+            self.assertEqual(output_file.stat().st_mtime_ns, 0)
+
+            history.append(_result("2026-06-02", 450, 90))
+            generate_nightly_chart(history, output_file)
+            self.assertNotEqual(output_file.stat().st_mtime_ns, 0)
+            self.assertIn("2026-06-02", output_file.read_text())
+            self.assertEqual(list(output_file.parent.iterdir()), [output_file])
+
+
+if __name__ == "__main__":
+    unittest.main()
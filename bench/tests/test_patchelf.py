@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from bench.patchelf import PT_INTERP, get_binary_interpreter
+
+
+def _elf64(interp: bytes) -> bytes:
+    """Minimal little-endian ELF64 image with a PT_LOAD and a PT_INTERP header."""
+    header = bytearray(64)
+    header[:7] = b"\x7fELF\x02\x01\x01"
+    struct.pack_into("<Q", header, 32, 64)
+    struct.pack_into("<HH", header, 54, 56, 2)
+    interp_offset = 64 + 2 * 56
+    load = struct.pack("<IIQQQQQQ", 1, 5, 0, 0, 0, 0, 0, 0)
+    interp_header = struct.pack(
+        "<IIQQQQQQ", PT_INTERP, 4, interp_offset, 0, 0, len(interp) + 1, 0, 1
+    )
+    return bytes(header) + load + interp_header + interp + b"\0"
+
+
+class GetBinaryInterpreterTests(unittest.TestCase):
+    def test_reads_interpreter_from_program_headers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binary = Path(temp_dir) / "bitcoind"
+            binary.write_bytes(_elf64(b"/lib64/ld-linux-x86-64.so.2"))
+
+            self.assertEqual(
+                get_binary_interpreter(binary), "/lib64/ld-linux-x86-64.so.2"
+            )
+
+    def test_non_elf_and_missing_files_have_no_interpreter(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "script.sh"
+            script.write_text("#!/bin/sh\n")
+
+            self.assertIsNone(get_binary_interpreter(script))
+            self.assertIsNone(get_binary_interpreter(Path(temp_dir) / "missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
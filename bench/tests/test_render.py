@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from bench.render import get_template_env
+
+
+def _render(source: str, **context) -> str:
+    return get_template_env().from_string(source).render(**context)
+
+
+def _dumps_kwargs(**kwargs):
+    return mock.patch.dict(get_template_env().policies, {"json.dumps_kwargs": kwargs})
+
+
+class TojsonTests(unittest.TestCase):
+    def test_passes_indent_and_sort_keys_through(self) -> None:
+        data = {"b": 1, "a": [2]}
+
+        self.assertEqual(_render("{{ d | tojson }}", d=data), '{"b":1,"a":[2]}')
+        self.assertEqual(
+            _render("{{ d | tojson(indent=2) }}", d=data),
+            '{\n  "b": 1,\n  "a": [\n    2\n  ]\n}',
+        )
+        with _dumps_kwargs(sort_keys=True):
+            self.assertEqual(_render("{{ d | tojson }}", d=data), '{"a":[2],"b":1}')
+
+    def test_rejects_unsupported_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            _render("{{ d | tojson(indent=4) }}", d={})
+        with _dumps_kwargs(separators=(",", ":")), self.assertRaises(TypeError):
+            _render("{{ d | tojson }}", d={})
+
+
+if __name__ == "__main__":
+    unittest.main()
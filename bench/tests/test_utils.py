@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bench.utils import GitState, copy_file, git_rev_parse
+
+
+class CopyFileTests(unittest.TestCase):
+    def test_copies_content_and_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = Path(temp_dir) / "run-flamegraph.svg"
+            src.write_bytes(b"<svg/>" * 1000)
+            src.chmod(0o640)
+            dest = Path(temp_dir) / "copy.svg"
+
+            copy_file(src, dest)
+
+            self.assertEqual(dest.read_bytes(), src.read_bytes())
+            self.assertEqual(dest.stat().st_mode, src.stat().st_mode)
+
+    def test_copies_without_ioctl_off_linux(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = Path(temp_dir) / "run-flamegraph.svg"
+            src.write_bytes(b"<svg/>")
+            dest = Path(temp_dir) / "copy.svg"
+
+            with (
+                mock.patch("bench.utils.sys.platform", "darwin"),
+                mock.patch("bench.utils.fcntl.ioctl") as ioctl,
+            ):
+                copy_file(src, dest)
+
+            ioctl.assert_not_called()
+            self.assertEqual(dest.read_bytes(), b"<svg/>")
+
+    def test_same_file_or_hard_link_is_left_intact(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = Path(temp_dir) / "run-flamegraph.svg"
+            src.write_bytes(b"<svg/>")
+            link = Path(temp_dir) / "link.svg"
+            os.link(src, link)
+
+            copy_file(src, src)
+            copy_file(src, link)
+
+            self.assertEqual(src.read_bytes(), b"<svg/>")
+
+    def test_failed_fallback_copy_leaves_no_truncated_dest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = Path(temp_dir) / "run-flamegraph.svg"
+            src.write_bytes(b"<svg/>")
+            dest = Path(temp_dir) / "copy.svg"
+
+            with (
+                mock.patch("bench.utils.fcntl.ioctl", side_effect=OSError),
+                mock.patch("bench.utils.shutil.copy2", side_effect=OSError),
+                self.assertRaises(OSError),
+            ):
+                copy_file(src, dest)
+
+            self.assertFalse(dest.exists())
+
+
+class GitStateTests(unittest.TestCase):
+    def test_save_and_restore_branch_or_detached_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+
+            def git(*args: str) -> str:
+                return subprocess.run(
+                    ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                    cwd=repo,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+
+            git("init", "-q", "-b", "main")
+            git("commit", "-q", "--allow-empty", "-m", "initial")
+
+            on_branch = GitState(repo)
+            on_branch.save()
+            self.assertEqual(on_branch.original_branch, "main")
+            self.assertIsNone(on_branch.original_commit)
+            self.assertFalse(on_branch.was_detached)
+
+            git("checkout", "-q", "--detach")
+            detached = GitState(repo)
+            detached.save()
+            self.assertIsNone(detached.original_branch)
+            self.assertEqual(detached.original_commit, git("rev-parse", "HEAD"))
+            self.assertTrue(detached.was_detached)
+
+            on_branch.restore()
+            self.assertEqual(git("symbolic-ref", "--short", "HEAD"), "main")
+            with self.assertLogs("bench.utils", level="DEBUG") as logs:
+                on_branch.restore()
+            self.assertIn("Already on branch: main", logs.output[0])
+
+            git("checkout", "-q", "--detach")
+            failure = subprocess.CalledProcessError(128, "git rev-parse")
+            with mock.patch.object(GitState, "_head", side_effect=failure):
+                on_branch.restore()
+            self.assertEqual(git("symbolic-ref", "--short", "HEAD"), "main")
+
+
+class GitRevParseTests(unittest.TestCase):
+    def test_full_hash_is_returned_without_running_git(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            not_a_repo = Path(temp_dir)
+            full_hash = "0123456789ABCDEF0123456789abcdef01234567"
+
+            self.assertEqual(git_rev_parse(full_hash, not_a_repo), full_hash.lower())
+
+
+if __name__ == "__main__":
+    unittest.main()
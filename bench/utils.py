@@ -1,46 +1,61 @@
-"""Utility functions for git operations."""
+"""Utility functions for git and file operations."""
 
 from __future__ import annotations
 
+import fcntl
 import logging
+import os
+import re
+import shutil
 import subprocess
+import sys
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Linux ioctl making a file share another file's extents (btrfs/XFS reflink).
+# Python 3.12+ exposes it; otherwise use _IOW(0x94, 9, int) from
+# <linux/fs.h> in the generic ioctl encoding (x86, arm, riscv). Where the
+# encoding differs the ioctl fails with ENOTTY/EINVAL and copy2 is used.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+# A full SHA-1 or SHA-256 object name, which rev-parse echoes back unchanged
+FULL_HASH_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}", re.IGNORECASE)
+
 
 class GitState:
     """Saved git state for restoration after operations."""
 
+    __slots__ = ("repo_path", "original_branch", "original_commit", "was_detached")
+
     def __init__(self, repo_path: Path | None = None):
         self.repo_path = repo_path or Path.cwd()
         self.original_branch: str | None = None
         self.original_commit: str | None = None
         self.was_detached: bool = False
 
-    def save(self) -> None:
-        """Save current git state."""
-        # Check if we're on a branch or detached HEAD
+    def _head(self) -> tuple[str, str]:
+        """Return HEAD's commit and the ref it points at ("HEAD" if detached)."""
+        # One rev-parse reports both, rather than symbolic-ref then rev-parse
         result = subprocess.run(
-            ["git", "symbolic-ref", "--short", "HEAD"],
+            ["git", "rev-parse", "HEAD", "--symbolic-full-name", "HEAD"],
             capture_output=True,
             text=True,
+            check=True,
             cwd=self.repo_path,
         )
+        commit, ref = result.stdout.split()
+        return commit, ref
+
+    def save(self) -> None:
+        """Save current git state."""
+        commit, ref = self._head()
 
-        if result.returncode == 0:
-            self.original_branch = result.stdout.strip()
+        if ref != "HEAD":
+            self.original_branch = ref.removeprefix("refs/heads/")
             self.was_detached = False
         else:
-            # Detached HEAD - save commit hash
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.repo_path,
-            )
-            self.original_commit = result.stdout.strip()
+            self.original_commit = commit
             self.was_detached = True
 
         logger.debug(
@@ -50,7 +65,20 @@ class GitState:
 
     def restore(self) -> None:
         """Restore saved git state."""
+        if not self.original_branch and not self.original_commit:
+            return
+
+        # Skip the checkout when HEAD never moved, e.g. after an early failure.
+        # restore() runs in cleanup paths, so if HEAD can't be read, fall
+        # through to the checkout rather than masking the original error.
+        try:
+            commit, ref = self._head()
+        except (subprocess.CalledProcessError, ValueError):
+            commit = ref = None
         if self.original_branch:
+            if ref == f"refs/heads/{self.original_branch}":
+                logger.debug(f"Already on branch: {self.original_branch}")
+                return
             logger.debug(f"Restoring branch: {self.original_branch}")
             subprocess.run(
                 ["git", "checkout", self.original_branch],
@@ -58,6 +86,9 @@ class GitState:
                 cwd=self.repo_path,
             )
         elif self.original_commit:
+            if ref == "HEAD" and commit == self.original_commit:
+                logger.debug(f"Already at detached HEAD: {self.original_commit}")
+                return
             logger.debug(f"Restoring detached HEAD: {self.original_commit}")
             subprocess.run(
                 ["git", "checkout", self.original_commit],
@@ -75,19 +106,24 @@ def git_checkout(commit: str, repo_path: Path | None = None) -> None:
     repo_path = repo_path or Path.cwd()
     logger.info(f"Checking out {commit[:12]}")
 
+    # Only stderr is reported, and only on failure
     result = subprocess.run(
         ["git", "checkout", commit],
         cwd=repo_path,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
 
     if result.returncode != 0:
-        raise GitError(f"Failed to checkout {commit}: {result.stderr}")
+        stderr = result.stderr.decode(errors="replace")
+        raise GitError(f"Failed to checkout {commit}: {stderr}")
 
 
 def git_rev_parse(ref: str, repo_path: Path | None = None) -> str:
     """Resolve a git reference to a full commit hash."""
+    if FULL_HASH_RE.fullmatch(ref):
+        return ref.lower()
+
     repo_path = repo_path or Path.cwd()
 
     result = subprocess.run(
@@ -101,3 +137,31 @@ def git_rev_parse(ref: str, repo_path: Path | None = None) -> str:
         raise GitError(f"Failed to resolve {ref}: {result.stderr}")
 
     return result.stdout.strip()
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """Copy a file with its metadata, as a reflink where supported.
+
+    Cloning shares the source's extents instead of copying any data. When
+    the filesystem can't (or src and dest are on different filesystems)
+    this falls back to shutil.copy2, which copies in-kernel on Linux.
+    """
+    # Opening dest for writing would truncate src if both are the same file
+    if dest.exists() and os.path.samefile(src, dest):
+        return
+    if sys.platform != "linux":
+        shutil.copy2(src, dest)
+        return
+
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            cloned = True
+        except OSError:
+            cloned = False
+    if not cloned:
+        # Don't leave the empty clone target behind if the copy fails too
+        dest.unlink()
+        shutil.copy2(src, dest)
+        return
+    shutil.copystat(src, dest)
@@ -155,6 +155,7 @@
             pkgs.python312
             pkgs.python312Packages.jinja2
             pkgs.python312Packages.matplotlib
+            pkgs.python312Packages.orjson
             pkgs.ruff
             pkgs.ty
             pkgs.util-linux
@@ -9,6 +9,7 @@ from test_framework.netutil import NETWORK_ERRORS
 from test_framework.util import assert_equal, str_to_b64str
 
 import http.client
+import select
 import time
 import urllib.parse
 
@@ -18,11 +19,20 @@ RPCSERVERTIMEOUT = 2
 MAX_HEADERS_SIZE = 8192
 MAX_BODY_SIZE = 32 * 1024 * 1024
 
+def submitblock_chunks(chunk_size):
+    """Yield a chunked submitblock body, building each large chunk only when sent"""
+    yield b'{"method": "submitblock", "params": ["'
+    for digit in b'0123':
+        yield bytes([digit]) * chunk_size
+    yield b'"]}'
+
 class BitcoinHTTPConnection:
     def __init__(self, node):
         self.url = urllib.parse.urlparse(node.url)
         self.authpair = f'{self.url.username}:{self.url.password}'
-        self.headers = {"Authorization": f"Basic {str_to_b64str(self.authpair)}"}
+        # Encoded once, for the default headers and the raw requests below
+        self.b64_auth = str_to_b64str(self.authpair)
+        self.headers = {"Authorization": f"Basic {self.b64_auth}"}
         self.reset_conn()
 
     def reset_conn(self):
@@ -67,7 +77,7 @@ class BitcoinHTTPConnection:
     def post_raw(self, path, data):
         data_bytes = data.encode("utf-8")
         req = f"POST {path} HTTP/1.1\r\n"
-        req += f'Authorization: Basic {str_to_b64str(self.authpair)}\r\n'
+        req += f'Authorization: Basic {self.b64_auth}\r\n'
         req += f'Content-Length: {len(data_bytes)}\r\n\r\n'
         self.send_raw(req.encode("ascii") + data_bytes)
 
@@ -78,8 +88,11 @@ class BitcoinHTTPConnection:
         return self.conn.sock.recv(1024)
 
     def expect_timeout(self, seconds):
-        # Wait for response, but expect a timeout disconnection
+        # Wait for response, but expect a timeout disconnection. The wait is
+        # bounded so a server that never disconnects fails here, not by hanging.
         start = time.time()
+        readable, _, _ = select.select([self.conn.sock], [], [], seconds + 2)
+        assert readable, f"Server did not disconnect within {seconds + 2} seconds"
         response1 = self.recv_raw()
         stop = time.time()
         # Server disconnected with EOF
@@ -285,18 +298,10 @@ class HTTPBasicsTest (BitcoinTestFramework):
         conn = BitcoinHTTPConnection(self.node)
         headers_chunked = conn.headers.copy()
         headers_chunked.update({"Transfer-encoding": "chunked"})
-        body_chunked = [
-            b'{"method": "submitblock", "params": ["',
-            b'0' * 1000000,
-            b'1' * 1000000,
-            b'2' * 1000000,
-            b'3' * 1000000,
-            b'"]}'
-        ]
         conn.conn.request(
             method='POST',
             url='/',
-            body=iter(body_chunked),
+            body=submitblock_chunks(1000000),
             headers=headers_chunked,
             encode_chunked=True)
         response1 = conn.recv_raw()
@@ -306,19 +311,11 @@ class HTTPBasicsTest (BitcoinTestFramework):
         conn = BitcoinHTTPConnection(self.node)
         headers_chunked = conn.headers.copy()
         headers_chunked.update({"Transfer-encoding": "chunked"})
-        body_chunked = [
-            b'{"method": "submitblock", "params": ["',
-            b'0' * 10000000,
-            b'1' * 10000000,
-            b'2' * 10000000,
-            b'3' * 10000000,
-            b'"]}'
-        ]
         try:
             conn.conn.request(
                 method='POST',
                 url='/',
-                body=iter(body_chunked),
+                body=submitblock_chunks(10000000),
                 headers=headers_chunked,
                 encode_chunked=True)
             self.log.info("Client finished sending request before connection was terminated")
@@ -347,16 +344,16 @@ class HTTPBasicsTest (BitcoinTestFramework):
 
         # Copied from http_incomplete_test_() in regress_http.c in libevent.
         # A complete request would have an additional "\r\n" at the end.
-        bad_http_request = "GET /test1 HTTP/1.1\r\nHost: somehost\r\n"
+        bad_http_request = b"GET /test1 HTTP/1.1\r\nHost: somehost\r\n"
         conn = BitcoinHTTPConnection(self.node)
-        conn.send_raw(bad_http_request.encode("ascii"))
+        conn.send_raw(bad_http_request)
 
         conn.expect_timeout(RPCSERVERTIMEOUT)
 
         # Sanity check -- complete requests don't timeout waiting for completion
-        good_http_request = "GET /test2 HTTP/1.1\r\nHost: somehost\r\n\r\n"
+        good_http_request = b"GET /test2 HTTP/1.1\r\nHost: somehost\r\n\r\n"
         conn.reset_conn()
-        conn.send_raw(good_http_request.encode("ascii"))
+        conn.send_raw(good_http_request)
         response = conn.recv_raw()
         assert response.startswith(b"HTTP/1.1 404 Not Found")
 
@@ -478,7 +475,7 @@ class HTTPBasicsTest (BitcoinTestFramework):
         raw = (
             f"POST / HTTP/1.1\r\n"
             f"Host: {conn.url.hostname}\r\n"
-            f"Authorization: Basic {str_to_b64str(conn.authpair)}\r\n"
+            f"Authorization: Basic {conn.b64_auth}\r\n"
             f"Content-Length: {len(chunk_size_line)}\r\n"
             f"Transfer-Encoding: chunked\r\n"
             f"\r\n"
@@ -500,7 +497,7 @@ class HTTPBasicsTest (BitcoinTestFramework):
         raw = (
             f"POST / HTTP/1.1\r\n"
             f"Host: {conn.url.hostname}\r\n"
-            f"Authorization: Basic {str_to_b64str(conn.authpair)}\r\n"
+            f"Authorization: Basic {conn.b64_auth}\r\n"
             f"Content-Length: {len(body)}\r\n"
             f"Content-Length: 999\r\n"
             f"\r\n"
@@ -519,7 +516,7 @@ class HTTPBasicsTest (BitcoinTestFramework):
         raw = (
             "GET /safe\x00/../etc/passwd HTTP/1.1\r\n"
             f"Host: {conn.url.hostname}\r\n"
-            f"Authorization: Basic {str_to_b64str(conn.authpair)}\r\n"
+            f"Authorization: Basic {conn.b64_auth}\r\n"
             "\r\n"
         ).encode("ascii")
         conn.send_raw(raw)
@@ -546,7 +543,7 @@ class HTTPBasicsTest (BitcoinTestFramework):
         self.log.info("Check that requests with whitespace in headers are rejected")
         # Extra whitespace before colon in header.
         conn = BitcoinHTTPConnection(self.node)
-        conn.headers = {"Authorization ": f"Basic {str_to_b64str(conn.authpair)}"}
+        conn.headers = {"Authorization ": f"Basic {conn.b64_auth}"}
         response = conn.post('/', '{"method": "getbestblockhash"}')
         assert_equal(response.status, http.client.BAD_REQUEST)
 
@@ -556,7 +553,7 @@ class HTTPBasicsTest (BitcoinTestFramework):
         # is considered unsafe and is explicitly deprecated in
         # https://www.rfc-editor.org/rfc/rfc7230#section-3.2.4
         conn = BitcoinHTTPConnection(self.node)
-        conn.headers = {"Authorization": f"Basic \n {str_to_b64str(conn.authpair)}"}
+        conn.headers = {"Authorization": f"Basic \n {conn.b64_auth}"}
         response = conn.post('/', '{"method": "getbestblockhash"}')
         assert_equal(response.status, http.client.BAD_REQUEST)
 